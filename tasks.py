@@ -111,7 +111,7 @@ def test(ctx: Context, verbose: bool = False, coverage: bool = False, no_purge:
 
     # Run E2E tests with parallel execution
     print("\nRunning E2E tests...")
-    e2e_cmd = "uv run python -m pytest tests/test_checkin_e2e.py -n 4"
+    e2e_cmd = "uv run python -m pytest tests/test_checkin_e2e.py -n 4 --dist=loadgroup"
     if verbose:
         e2e_cmd += " -v"
     ctx.run(e2e_cmd, pty=True)
@@ -152,8 +152,12 @@ def test_e2e(ctx: Context, verbose: bool = False, workers: int = 4, no_purge: bo
     Note: Server should be started with registration enabled for registration tests:
         WINEBOX_AUTH_REGISTRATION_ENABLED=true invoke start-background
     """
-    # Run all E2E tests (checkin and registration)
-    cmd = f"uv run python -m pytest tests/test_checkin_e2e.py tests/test_registration_e2e.py -n {workers}"
+    # Run all E2E tests (checkin, registration and import); loadgroup keeps
+    # the import tests, which share one xdist group, on a single worker
+    cmd = (
+        "uv run python -m pytest tests/test_checkin_e2e.py tests/test_registration_e2e.py "
+        f"tests/test_import_e2e.py -n {workers} --dist=loadgroup"
+    )
     if verbose:
         cmd += " -v"
     ctx.run(cmd, pty=True)
@@ -4,10 +4,12 @@ import asyncio
 import os
 import uuid
 from collections.abc import AsyncGenerator
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
-from datetime import datetime
+from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Generator
+from typing import Any, Generator
 import tempfile
 from unittest.mock import AsyncMock, patch
 
@@ -16,15 +18,122 @@ import pytest_asyncio
 from beanie import init_beanie
 from httpx import ASGITransport, AsyncClient
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import MongoClient
+from pymongo.errors import PyMongoError
 
+from winebox.cli.user_admin import add_user
+from winebox.cli.user_admin import init_db as init_admin_db
 from winebox.database import get_document_models
-from winebox.models import User
+from winebox.models import InventoryInfo, User, Wine
 from winebox.services.auth import get_password_hash, create_access_token
 
 
 # MongoDB connection URL for tests (can be overridden with env var)
 TEST_MONGODB_URL = os.environ.get("TEST_MONGODB_URL", "mongodb://localhost:27017")
 
+# One test database per process (each xdist worker imports this separately),
+# emptied between tests rather than recreated. The worker id makes a database
+# left behind by a crashed worker easy to trace; the uuid keeps concurrent
+# runs against the same server apart.
+TEST_DB_NAME = (
+    f"test_winebox_{os.environ.get('PYTEST_XDIST_WORKER', 'main')}_{uuid.uuid4().hex[:8]}"
+)
+
+
+# Minimal valid PNG (1x1 pixel, red): PNG header and minimal IHDR, IDAT,
+# IEND chunks
+SAMPLE_PNG = (
+    b"\x89PNG\r\n\x1a\n"  # PNG signature
+    b"\x00\x00\x00\x0d"  # IHDR length
+    b"IHDR"
+    b"\x00\x00\x00\x01"  # width: 1
+    b"\x00\x00\x00\x01"  # height: 1
+    b"\x08\x02"  # bit depth: 8, color type: RGB
+    b"\x00\x00\x00"  # compression, filter, interlace
+    b"\x90\x77\x53\xde"  # CRC
+    b"\x00\x00\x00\x0c"  # IDAT length
+    b"IDAT"
+    b"\x08\xd7\x63\xf8\xff\xff\x3f\x00"  # compressed data
+    b"\x05\xfe\x02\xfe"  # CRC
+    b"\xa3\x1a\x8d\xeb"  # CRC
+    b"\x00\x00\x00\x00"  # IEND length
+    b"IEND"
+    b"\xae\x42\x60\x82"  # CRC
+)
+
+
+@lru_cache(maxsize=None)
+def cached_password_hash(password: str) -> str:
+    """Hash a test password once per process.
+
+    Argon2 is deliberately slow (hundreds of milliseconds per hash), and the
+    per-test fixtures re-create the same users with the same passwords after
+    every collection wipe. The salted hash still verifies normally.
+    """
+    return get_password_hash(password)
+
+
+def label_files(image_bytes: bytes) -> dict[str, tuple[str, bytes, str]]:
+    """Build the multipart files dict for a front label upload.
+
+    httpx accepts raw bytes as file content, so no BytesIO wrapper is needed.
+    """
+    return {"front_label": ("test.png", image_bytes, "image/png")}
+
+
+async def seed_wines(
+    wines: list[dict[str, Any]], owner_email: str = "test@example.com"
+) -> None:
+    """Insert wines for an existing user in one write, bypassing check-in.
+
+    Use this to arrange fixtures for read-side tests (search, listing);
+    the check-in tests still cover the full upload pipeline.
+
+    Args:
+        wines: Wine field values; an optional "quantity" sets the inventory.
+        owner_email: Email of the owning user (the client fixture's user).
+    """
+    owner = await User.find_one(User.email == owner_email)
+    assert owner is not None, f"seed_wines: no user {owner_email}"
+    await Wine.insert_many([
+        Wine(
+            owner_id=owner.id,
+            inventory=InventoryInfo(quantity=fields.get("quantity", 1)),
+            **{k: v for k, v in fields.items() if k != "quantity"},
+        )
+        for fields in wines
+    ])
+
+
+def add_user_in_process(email: str, password: str) -> None:
+    """Create a verified user through winebox-admin's add_user, in-process.
+
+    Used by the Playwright e2e suites to provision their worker accounts.
+    Runs on a helper thread because sync Playwright keeps an event loop
+    registered on the main thread, which rules out asyncio.run() there.
+    An account left over from a previous run is reused.
+
+    Args:
+        email: Email of the user to create.
+        password: Plain-text password for the new user.
+
+    Raises:
+        RuntimeError: If add_user() exits instead of creating the user.
+    """
+    async def create() -> None:
+        await init_admin_db()
+        if await User.find_one(User.email == email) is None:
+            await add_user(email, password, skip_db_init=True)
+
+    def run() -> None:
+        try:
+            asyncio.run(create())
+        except SystemExit as e:
+            raise RuntimeError(f"add_user exited with status {e.code}") from e
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        executor.submit(run).result(timeout=30)
+
 
 # Create a test-specific app to avoid lifespan conflicts
 def create_test_app():
@@ -87,13 +196,28 @@ def event_loop_policy():
     return asyncio.DefaultEventLoopPolicy()
 
 
-@pytest_asyncio.fixture(scope="function")
+@pytest.fixture(scope="session")
+def browser_type_launch_args(browser_type_launch_args: dict, browser_name: str) -> dict:
+    """Tune the session-wide Playwright browser launch for E2E tests.
+
+    pytest-playwright launches one browser per worker session and gives each
+    test a fresh context, so only contexts are torn down between tests.
+    Chromium's /dev/shm usage is disabled since small shared-memory mounts
+    (containers, CI) make it crash or stall under parallel workers.
+    """
+    if browser_name != "chromium":
+        return browser_type_launch_args
+    args = [*browser_type_launch_args.get("args", []), "--disable-dev-shm-usage"]
+    return {**browser_type_launch_args, "args": args}
+
+
+@pytest_asyncio.fixture(scope="session")
 async def mongo_client():
-    """Create a MongoDB client for testing.
+    """Create a MongoDB client shared by every test in this worker.
 
-    Function-scoped to avoid event loop issues with pytest-xdist.
-    Motor manages its own connection pool internally, so connections
-    are reused at the driver level even with function-scoped fixtures.
+    Tests and fixtures all run on the worker's session event loop (see
+    asyncio_default_*_loop_scope in pyproject.toml), so one Motor client and
+    its connection pool serve the whole session.
     """
     client = AsyncIOMotorClient(
         TEST_MONGODB_URL,
@@ -104,39 +228,65 @@ async def mongo_client():
     client.close()
 
 
-@pytest_asyncio.fixture(scope="function")
-async def init_test_db(mongo_client):
-    """Initialize Beanie with a unique test database.
+@pytest.fixture(scope="session")
+def test_db_name() -> Generator[str, None, None]:
+    """Return this worker's test database name and drop it when the session ends.
 
-    Creates a unique database for each test function and drops it after the test.
-    The MongoDB client connection is reused across tests within each worker.
+    A synchronous client is used for the drop so it still runs after the
+    session event loop and the async fixtures have been torn down.
     """
-    # Create unique database name for this test
-    db_name = f"test_winebox_{uuid.uuid4().hex[:8]}"
-    db = mongo_client[db_name]
+    yield TEST_DB_NAME
+
+    client = MongoClient(TEST_MONGODB_URL, serverSelectionTimeoutMS=5000)
+    try:
+        client.drop_database(TEST_DB_NAME)
+    except PyMongoError:
+        pass
+    finally:
+        client.close()
+
+
+@pytest_asyncio.fixture(scope="session")
+async def test_database(mongo_client, test_db_name):
+    """Initialize Beanie with this worker's test database, once per session."""
+    db = mongo_client[test_db_name]
 
     await init_beanie(
         database=db,
         document_models=get_document_models(),
     )
-    yield db
+    return db
+
+
+@pytest_asyncio.fixture(scope="function")
+async def init_test_db(test_database):
+    """Provide the initialized test database, emptied after each test.
+
+    The database (and the indexes init_beanie creates) is reused across tests
+    in the worker; every collection is emptied after each test, which is much
+    cheaper than dropping and rebuilding the database per test.
+    """
+    yield test_database
 
-    # Cleanup: drop the entire test database
-    await mongo_client.drop_database(db_name)
+    # Cleanup: empty every collection, keeping collections and indexes
+    for collection_name in await test_database.list_collection_names():
+        await test_database[collection_name].delete_many({})
 
 
 @pytest_asyncio.fixture(scope="function")
 async def client(init_test_db) -> AsyncGenerator[AsyncClient, None]:
     """Create an async test client with overridden database and auth."""
+    now = datetime.now(timezone.utc)
+
     # Create a test user
     test_user = User(
         email="test@example.com",
-        hashed_password=get_password_hash("testpassword"),
+        hashed_password=cached_password_hash("testpassword"),
         is_active=True,
         is_verified=True,
         is_superuser=False,
-        created_at=datetime.utcnow(),
-        updated_at=datetime.utcnow(),
+        created_at=now,
+        updated_at=now,
     )
     await test_user.insert()
 
@@ -161,30 +311,10 @@ def temp_image_dir() -> Generator[Path, None, None]:
         yield Path(tmpdir)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_image_bytes() -> bytes:
     """Create sample image bytes for testing."""
-    # Create a minimal valid PNG (1x1 pixel, red)
-    # PNG header and minimal IHDR, IDAT, IEND chunks
-    png_data = bytes([
-        0x89, 0x50, 0x4E, 0x47, 0x0D, 0x0A, 0x1A, 0x0A,  # PNG signature
-        0x00, 0x00, 0x00, 0x0D,  # IHDR length
-        0x49, 0x48, 0x44, 0x52,  # IHDR
-        0x00, 0x00, 0x00, 0x01,  # width: 1
-        0x00, 0x00, 0x00, 0x01,  # height: 1
-        0x08, 0x02,  # bit depth: 8, color type: RGB
-        0x00, 0x00, 0x00,  # compression, filter, interlace
-        0x90, 0x77, 0x53, 0xDE,  # CRC
-        0x00, 0x00, 0x00, 0x0C,  # IDAT length
-        0x49, 0x44, 0x41, 0x54,  # IDAT
-        0x08, 0xD7, 0x63, 0xF8, 0xFF, 0xFF, 0x3F, 0x00,  # compressed data
-        0x05, 0xFE, 0x02, 0xFE,  # CRC
-        0xA3, 0x1A, 0x8D, 0xEB,  # CRC
-        0x00, 0x00, 0x00, 0x00,  # IEND length
-        0x49, 0x45, 0x4E, 0x44,  # IEND
-        0xAE, 0x42, 0x60, 0x82,  # CRC
-    ])
-    return png_data
+    return SAMPLE_PNG
 
 
 @pytest.fixture
@@ -1,14 +1,14 @@
 """Tests for admin panel endpoints."""
 
-import io
-from datetime import datetime
+from datetime import datetime, timezone
 
 import pytest
 import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
 
+from tests.conftest import cached_password_hash, label_files
 from winebox.models import User
-from winebox.services.auth import create_access_token, get_password_hash
+from winebox.services.auth import create_access_token
 
 
 @pytest_asyncio.fixture(scope="function")
@@ -16,15 +16,17 @@ async def admin_client(init_test_db):
     """Create an authenticated admin client."""
     from tests.conftest import get_test_app
 
+    now = datetime.now(timezone.utc)
+
     # Create admin user
     admin_user = User(
         email="admin@example.com",
-        hashed_password=get_password_hash("adminpassword"),
+        hashed_password=cached_password_hash("adminpassword"),
         is_active=True,
         is_verified=True,
         is_superuser=True,  # This is an admin
-        created_at=datetime.utcnow(),
-        updated_at=datetime.utcnow(),
+        created_at=now,
+        updated_at=now,
     )
     await admin_user.insert()
     token = create_access_token(data={"sub": "admin@example.com"})
@@ -44,15 +46,17 @@ async def regular_user_client(init_test_db):
     """Create an authenticated regular (non-admin) client."""
     from tests.conftest import get_test_app
 
+    now = datetime.now(timezone.utc)
+
     # Create regular user
     user = User(
         email="user@example.com",
-        hashed_password=get_password_hash("userpassword"),
+        hashed_password=cached_password_hash("userpassword"),
         is_active=True,
         is_verified=True,
         is_superuser=False,  # Not an admin
-        created_at=datetime.utcnow(),
-        updated_at=datetime.utcnow(),
+        created_at=now,
+        updated_at=now,
     )
     await user.insert()
     token = create_access_token(data={"sub": "user@example.com"})
@@ -72,51 +76,53 @@ async def populated_admin_client(init_test_db, sample_image_bytes):
     """Create admin client with some users and wines."""
     from tests.conftest import get_test_app
 
+    now = datetime.now(timezone.utc)
+
     # Create admin user
     admin_user = User(
         email="admin@example.com",
-        hashed_password=get_password_hash("adminpassword"),
+        hashed_password=cached_password_hash("adminpassword"),
         is_active=True,
         is_verified=True,
         is_superuser=True,
-        created_at=datetime.utcnow(),
-        updated_at=datetime.utcnow(),
+        created_at=now,
+        updated_at=now,
     )
     await admin_user.insert()
 
     # Create regular user 1
     user1 = User(
         email="user1@example.com",
-        hashed_password=get_password_hash("password1"),
+        hashed_password=cached_password_hash("password1"),
         is_active=True,
         is_verified=True,
         is_superuser=False,
-        created_at=datetime.utcnow(),
-        updated_at=datetime.utcnow(),
+        created_at=now,
+        updated_at=now,
     )
     await user1.insert()
 
     # Create regular user 2 (unverified)
     user2 = User(
         email="user2@example.com",
-        hashed_password=get_password_hash("password2"),
+        hashed_password=cached_password_hash("password2"),
         is_active=True,
         is_verified=False,  # Not verified
         is_superuser=False,
-        created_at=datetime.utcnow(),
-        updated_at=datetime.utcnow(),
+        created_at=now,
+        updated_at=now,
     )
     await user2.insert()
 
     # Create inactive user
     user3 = User(
         email="inactive@example.com",
-        hashed_password=get_password_hash("password3"),
+        hashed_password=cached_password_hash("password3"),
         is_active=False,  # Inactive
         is_verified=True,
         is_superuser=False,
-        created_at=datetime.utcnow(),
-        updated_at=datetime.utcnow(),
+        created_at=now,
+        updated_at=now,
     )
     await user3.insert()
 
@@ -131,7 +137,7 @@ async def populated_admin_client(init_test_db, sample_image_bytes):
         base_url="http://test",
         headers={"Authorization": f"Bearer {user1_token}"},
     ) as user1_client:
-        files = {"front_label": ("test.png", io.BytesIO(sample_image_bytes), "image/png")}
+        files = label_files(sample_image_bytes)
         data = {"name": "User1 Wine", "quantity": "5"}
         await user1_client.post("/api/wines/checkin", files=files, data=data)
 
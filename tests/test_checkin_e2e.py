@@ -17,7 +17,7 @@ from pathlib import Path
 from typing import Generator
 
 import pytest
-from playwright.sync_api import Page, expect
+from playwright.sync_api import Browser, Page, expect
 
 # Test data directory containing wine label images
 TEST_DATA_DIR = Path(__file__).parent / "data" / "wine_labels"
@@ -59,21 +59,32 @@ def worker_user(request: pytest.FixtureRequest) -> Generator[tuple[str, str], No
 
     # Create the user via CLI
     # Retry a few times in case of transient issues
+    command = ["uv", "run", "winebox-admin", "add", email, "--password", password]
     max_retries = 3
     created = False
+    result = None
     for attempt in range(max_retries):
+        # Discard output on the happy path - no pipes to set up or decode
+        returncode = subprocess.run(
+            command,
+            cwd=PROJECT_DIR,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            timeout=30,
+        ).returncode
+        if returncode == 0:
+            created = True
+            break
+        # Failed: re-run capturing output to see why
         result = subprocess.run(
-            ["uv", "run", "winebox-admin", "add", email, "--password", password],
+            command,
             cwd=PROJECT_DIR,
             capture_output=True,
             timeout=30,
             text=True,
         )
         # Check if user was created or already exists
-        if result.returncode == 0:
-            created = True
-            break
-        if "already exists" in (result.stdout + result.stderr):
+        if result.returncode == 0 or "already in use" in (result.stdout + result.stderr):
             created = True
             break
         # Wait before retry
@@ -105,42 +116,72 @@ def test_user(worker_user: tuple[str, str]) -> tuple[str, str]:
     return worker_user
 
 
-@pytest.fixture(scope="function")
-def authenticated_page(page: Page, test_user: tuple[str, str]) -> Page:
-    """Log in and return an authenticated page with a unique test user."""
-    email, password = test_user
+@pytest.fixture(scope="session")
+def auth_storage_state(
+    browser: Browser,
+    browser_context_args: dict,
+    worker_user: tuple[str, str],
+    tmp_path_factory: pytest.TempPathFactory,
+) -> Path:
+    """Log in once per worker and save the browser storage state to a file.
+
+    The JWT lives in localStorage, so contexts created from this state start
+    out already logged in.
+    """
+    email, password = worker_user
+    context = browser.new_context(**browser_context_args)
+    try:
+        page = context.new_page()
+        page.goto(BASE_URL)
 
-    # Clear all browser state to ensure clean login
-    page.context.clear_cookies()
-    # Also clear localStorage which stores the JWT token
-    page.goto(BASE_URL)
-    page.evaluate("localStorage.clear()")
+        # Wait for login form
+        page.wait_for_selector("#login-form", state="visible", timeout=10000)
 
-    # Reload to get fresh login page
-    page.reload()
+        # Fill in credentials
+        page.fill("#login-email", email)
+        page.fill("#login-password", password)
+
+        # Click login
+        page.click("#login-form button[type='submit']")
 
-    # Wait for login form
-    page.wait_for_selector("#login-form", state="visible", timeout=10000)
+        # Wait for either successful login or error message
+        try:
+            page.wait_for_selector("#main-content", state="visible", timeout=15000)
+        except Exception:
+            # Check if there's a login error
+            error_elem = page.locator("#login-error")
+            if error_elem.is_visible():
+                error_text = error_elem.text_content()
+                raise AssertionError(f"Login failed for user '{email}': {error_text}")
+            raise
 
-    # Fill in credentials
-    page.fill("#login-email", email)
-    page.fill("#login-password", password)
+        state_path = tmp_path_factory.mktemp("auth") / "storage_state.json"
+        context.storage_state(path=state_path)
+    finally:
+        context.close()
 
-    # Click login
-    page.click("#login-form button[type='submit']")
+    return state_path
 
-    # Wait for either successful login or error message
-    try:
-        page.wait_for_selector("#main-content", state="visible", timeout=15000)
-    except Exception:
-        # Check if there's a login error
-        error_elem = page.locator("#login-error")
-        if error_elem.is_visible():
-            error_text = error_elem.text_content()
-            raise AssertionError(f"Login failed for user '{email}': {error_text}")
-        raise
-
-    return page
+
+@pytest.fixture(scope="function")
+def authenticated_page(
+    browser: Browser,
+    browser_context_args: dict,
+    auth_storage_state: Path,
+) -> Generator[Page, None, None]:
+    """Return a page in a fresh context that is already logged in.
+
+    Each test still gets its own context, seeded from the worker's saved
+    login state instead of logging in through the form again.
+    """
+    context = browser.new_context(**browser_context_args, storage_state=auth_storage_state)
+    page = context.new_page()
+    page.goto(BASE_URL)
+    page.wait_for_selector("#main-content", state="visible", timeout=15000)
+
+    yield page
+
+    context.close()
 
 
 @pytest.fixture
@@ -8,6 +8,8 @@ import pytest
 import yaml
 from httpx import AsyncClient
 
+from tests.conftest import label_files
+
 
 @pytest.mark.asyncio
 async def test_export_wines_json_empty(client: AsyncClient) -> None:
@@ -79,9 +81,7 @@ async def test_export_wines_yaml_empty(client: AsyncClient) -> None:
 async def test_export_wines_json_with_data(client: AsyncClient, sample_image_bytes: bytes) -> None:
     """Test exporting wines in JSON format with data."""
     # Create a wine
-    files = {
-        "front_label": ("test.png", io.BytesIO(sample_image_bytes), "image/png"),
-    }
+    files = label_files(sample_image_bytes)
     data = {
         "name": "Test Wine",
         "winery": "Test Winery",
@@ -109,9 +109,7 @@ async def test_export_wines_json_with_data(client: AsyncClient, sample_image_byt
 async def test_export_wines_csv_with_data(client: AsyncClient, sample_image_bytes: bytes) -> None:
     """Test exporting wines in CSV format with data."""
     # Create a wine
-    files = {
-        "front_label": ("test.png", io.BytesIO(sample_image_bytes), "image/png"),
-    }
+    files = label_files(sample_image_bytes)
     data = {
         "name": "Export Test Wine",
         "winery": "Export Winery",
@@ -199,9 +197,7 @@ async def test_export_wines_filter_country(client: AsyncClient, sample_image_byt
 async def test_export_wines_exclude_blends_and_scores(client: AsyncClient, sample_image_bytes: bytes) -> None:
     """Test exporting wines without blends and scores."""
     # Create a wine
-    files = {
-        "front_label": ("test.png", io.BytesIO(sample_image_bytes), "image/png"),
-    }
+    files = label_files(sample_image_bytes)
     data = {"name": "Simple Wine", "quantity": "1"}
     await client.post("/api/wines/checkin", files=files, data=data)
 
@@ -257,9 +253,7 @@ async def test_export_transactions_csv_empty(client: AsyncClient) -> None:
 async def test_export_transactions_with_data(client: AsyncClient, sample_image_bytes: bytes) -> None:
     """Test exporting transactions with actual data."""
     # Create a wine (which creates a CHECK_IN transaction)
-    files = {
-        "front_label": ("test.png", io.BytesIO(sample_image_bytes), "image/png"),
-    }
+    files = label_files(sample_image_bytes)
     data = {"name": "Transaction Test Wine", "quantity": "5"}
     checkin_response = await client.post("/api/wines/checkin", files=files, data=data)
     wine_id = checkin_response.json()["id"]
@@ -284,9 +278,7 @@ async def test_export_transactions_with_data(client: AsyncClient, sample_image_b
 async def test_export_transactions_csv_with_data(client: AsyncClient, sample_image_bytes: bytes) -> None:
     """Test exporting transactions in CSV format with data."""
     # Create a wine
-    files = {
-        "front_label": ("test.png", io.BytesIO(sample_image_bytes), "image/png"),
-    }
+    files = label_files(sample_image_bytes)
     data = {"name": "CSV Export Wine", "quantity": "3"}
     await client.post("/api/wines/checkin", files=files, data=data)
 
@@ -309,9 +301,7 @@ async def test_export_transactions_csv_with_data(client: AsyncClient, sample_ima
 async def test_export_transactions_filter_type(client: AsyncClient, sample_image_bytes: bytes) -> None:
     """Test exporting transactions with transaction_type filter."""
     # Create and checkout wine
-    files = {
-        "front_label": ("test.png", io.BytesIO(sample_image_bytes), "image/png"),
-    }
+    files = label_files(sample_image_bytes)
     data = {"name": "Filter Test Wine", "quantity": "5"}
     checkin_response = await client.post("/api/wines/checkin", files=files, data=data)
     wine_id = checkin_response.json()["id"]
@@ -356,9 +346,7 @@ async def test_export_transactions_filter_wine_id(client: AsyncClient, sample_im
 async def test_export_transactions_without_wine_details(client: AsyncClient, sample_image_bytes: bytes) -> None:
     """Test exporting transactions without wine details."""
     # Create a wine
-    files = {
-        "front_label": ("test.png", io.BytesIO(sample_image_bytes), "image/png"),
-    }
+    files = label_files(sample_image_bytes)
     await client.post("/api/wines/checkin", files=files, data={"name": "No Details Wine", "quantity": "1"})
 
     # Export without wine details
@@ -375,9 +363,7 @@ async def test_export_transactions_without_wine_details(client: AsyncClient, sam
 async def test_export_transactions_xlsx(client: AsyncClient, sample_image_bytes: bytes) -> None:
     """Test exporting transactions in Excel format."""
     # Create a wine
-    files = {
-        "front_label": ("test.png", io.BytesIO(sample_image_bytes), "image/png"),
-    }
+    files = label_files(sample_image_bytes)
     await client.post("/api/wines/checkin", files=files, data={"name": "Excel Test Wine", "quantity": "2"})
 
     response = await client.get("/api/export/transactions?format=xlsx")
@@ -394,9 +380,7 @@ async def test_export_transactions_xlsx(client: AsyncClient, sample_image_bytes:
 async def test_export_transactions_yaml(client: AsyncClient, sample_image_bytes: bytes) -> None:
     """Test exporting transactions in YAML format."""
     # Create a wine
-    files = {
-        "front_label": ("test.png", io.BytesIO(sample_image_bytes), "image/png"),
-    }
+    files = label_files(sample_image_bytes)
     await client.post("/api/wines/checkin", files=files, data={"name": "YAML Test Wine", "quantity": "1"})
 
     response = await client.get("/api/export/transactions?format=yaml")
@@ -4,11 +4,13 @@ These tests require a running WineBox server. Start the server with:
     invoke start-background
 
 Run with: uv run python -m pytest -m e2e tests/test_import_e2e.py -v
+
+All tests share one xdist group, so with ``-n auto --dist=loadgroup`` they run
+on a single worker and the worker user and login setup happen only once.
 """
 
-import csv
 import os
-import subprocess
+import sys
 import time
 from pathlib import Path
 from typing import Generator
@@ -16,11 +18,30 @@ from typing import Generator
 import pytest
 from playwright.sync_api import Page, expect
 
+from tests.conftest import add_user_in_process
+
 # Server URL - can be overridden with WINEBOX_TEST_URL env var
 BASE_URL = os.environ.get("WINEBOX_TEST_URL", "http://localhost:8000")
 
-# Project directory for running CLI commands
-PROJECT_DIR = Path(__file__).parent.parent
+pytestmark = [pytest.mark.e2e, pytest.mark.xdist_group("import_e2e")]
+
+# CSV fixture contents - no cell needs quoting, so these are written verbatim
+SAMPLE_CSV = (
+    "Wine Name,Producer,Year,Country,Grape,Region,Type,Quantity,Cellar Location\n"
+    "Chateau Petrus,Petrus,2010,France,Merlot,Pomerol,Red,1,Rack A1\n"
+    "Tignanello,Antinori,2018,Italy,Sangiovese,Tuscany,Red,3,Rack B2\n"
+    "Cloudy Bay Sauvignon Blanc,Cloudy Bay,2022,New Zealand,Sauvignon Blanc,"
+    "Marlborough,White,6,Rack C1\n"
+    "Dom Perignon,Moet & Chandon,2012,France,Chardonnay,Champagne,Sparkling,2,Rack D3\n"
+)
+
+SPIRITS_CSV = (
+    "Wine Name,Producer,Year,Country,Type,Quantity\n"
+    "Chateau Margaux,Margaux,2015,France,Red,2\n"
+    "Jameson Irish Whiskey,Jameson,2023,Ireland,Whiskey,1\n"
+    "Barolo Riserva,Conterno,2016,Italy,Red,4\n"
+    "Tanqueray,Diageo,,UK,Gin,1\n"
+)
 
 
 def get_worker_id(request: pytest.FixtureRequest) -> str:
@@ -44,29 +65,16 @@ def worker_user(request: pytest.FixtureRequest) -> Generator[tuple[str, str], No
     password = "testpass123"
 
     max_retries = 3
-    created = False
-    result = None
     for attempt in range(max_retries):
-        result = subprocess.run(
-            ["uv", "run", "winebox-admin", "add", email, "--password", password],
-            cwd=PROJECT_DIR,
-            capture_output=True,
-            timeout=30,
-            text=True,
-        )
-        if result.returncode == 0 or "already exists" in (result.stdout + result.stderr):
-            created = True
+        try:
+            add_user_in_process(email, password)
             break
-        if attempt < max_retries - 1:
-            time.sleep(1.0)
-
-    if not created:
-        import sys
-        print(f"WARNING: Failed to create user {email}", file=sys.stderr)
-        print(f"  stdout: {result.stdout}", file=sys.stderr)
-        print(f"  stderr: {result.stderr}", file=sys.stderr)
+        except Exception as e:
+            if attempt < max_retries - 1:
+                time.sleep(1.0)
+            else:
+                print(f"WARNING: Failed to create user {email}: {e}", file=sys.stderr)
 
-    time.sleep(0.5)
     yield email, password
 
 
@@ -81,14 +89,22 @@ def authenticated_page(page: Page, test_user: tuple[str, str]) -> Page:
     """Log in and return an authenticated page."""
     email, password = test_user
 
-    page.context.clear_cookies()
+    # pytest-playwright gives every test a fresh browser context, so there are
+    # no cookies or localStorage tokens to clear before loading the app.
     page.goto(BASE_URL)
-    page.evaluate("localStorage.clear()")
-    page.reload()
 
     page.wait_for_selector("#login-form", state="visible", timeout=10000)
-    page.fill("#login-email", email)
-    page.fill("#login-password", password)
+    # Fill both credentials in a single round-trip rather than two page.fill calls
+    page.evaluate(
+        """([email, password]) => {
+            for (const [id, value] of [['login-email', email], ['login-password', password]]) {
+                const input = document.getElementById(id);
+                input.value = value;
+                input.dispatchEvent(new Event('input', { bubbles: true }));
+            }
+        }""",
+        [email, password],
+    )
     page.click("#login-form button[type='submit']")
 
     try:
@@ -107,19 +123,7 @@ def authenticated_page(page: Page, test_user: tuple[str, str]) -> Page:
 def sample_csv(tmp_path: Path) -> Path:
     """Create a sample CSV file for import testing."""
     csv_file = tmp_path / "test_wines.csv"
-    with open(csv_file, "w", newline="") as f:
-        writer = csv.writer(f)
-        writer.writerow(["Wine Name", "Producer", "Year", "Country", "Grape",
-                         "Region", "Type", "Quantity", "Cellar Location"])
-        writer.writerow(["Chateau Petrus", "Petrus", "2010", "France", "Merlot",
-                         "Pomerol", "Red", "1", "Rack A1"])
-        writer.writerow(["Tignanello", "Antinori", "2018", "Italy", "Sangiovese",
-                         "Tuscany", "Red", "3", "Rack B2"])
-        writer.writerow(["Cloudy Bay Sauvignon Blanc", "Cloudy Bay", "2022",
-                         "New Zealand", "Sauvignon Blanc", "Marlborough", "White",
-                         "6", "Rack C1"])
-        writer.writerow(["Dom Perignon", "Moet & Chandon", "2012", "France",
-                         "Chardonnay", "Champagne", "Sparkling", "2", "Rack D3"])
+    csv_file.write_text(SAMPLE_CSV, encoding="utf-8")
     return csv_file
 
 
@@ -127,17 +131,7 @@ def sample_csv(tmp_path: Path) -> Path:
 def csv_with_spirits(tmp_path: Path) -> Path:
     """Create a CSV file that includes non-wine rows."""
     csv_file = tmp_path / "mixed_drinks.csv"
-    with open(csv_file, "w", newline="") as f:
-        writer = csv.writer(f)
-        writer.writerow(["Wine Name", "Producer", "Year", "Country", "Type",
-                         "Quantity"])
-        writer.writerow(["Chateau Margaux", "Margaux", "2015", "France", "Red",
-                         "2"])
-        writer.writerow(["Jameson Irish Whiskey", "Jameson", "2023", "Ireland",
-                         "Whiskey", "1"])
-        writer.writerow(["Barolo Riserva", "Conterno", "2016", "Italy", "Red",
-                         "4"])
-        writer.writerow(["Tanqueray", "Diageo", "", "UK", "Gin", "1"])
+    csv_file.write_text(SPIRITS_CSV, encoding="utf-8")
     return csv_file
 
 
@@ -150,11 +144,19 @@ def _navigate_to_import(page: Page) -> None:
 def _upload_csv(page: Page, csv_path: Path) -> None:
     """Upload a CSV file via the import page file input."""
     page.set_input_files("#import-file-input", str(csv_path))
-    # Wait for the mapping step to appear (actual ID: import-step-map)
-    page.wait_for_selector("#import-step-map", state="visible", timeout=15000)
+    # Assert the mapping step appears (actual ID: import-step-map). This is the
+    # only wait for it, so callers should not re-check its visibility.
+    expect(page.locator("#import-step-map")).to_be_visible(timeout=15000)
+
+
+@pytest.fixture
+def mapping_page(authenticated_page: Page, sample_csv: Path) -> Page:
+    """Return an authenticated page sitting on the mapping step for sample_csv."""
+    _navigate_to_import(authenticated_page)
+    _upload_csv(authenticated_page, sample_csv)
+    return authenticated_page
 
 
-@pytest.mark.e2e
 class TestImportPageNavigation:
     """Test basic import page navigation and display."""
 
@@ -186,7 +188,6 @@ class TestImportPageNavigation:
         expect(upload_area).to_contain_text(".xlsx")
 
 
-@pytest.mark.e2e
 class TestImportUpload:
     """Test the file upload step of the import workflow."""
 
@@ -196,8 +197,6 @@ class TestImportUpload:
         _navigate_to_import(page)
         _upload_csv(page, sample_csv)
 
-        expect(page.locator("#import-step-map")).to_be_visible()
-
         mapping_table = page.locator(".import-mapping-table")
         expect(mapping_table).to_be_visible()
 
@@ -234,43 +233,34 @@ class TestImportUpload:
         expect(preview).to_contain_text("Chateau Petrus")
 
 
-@pytest.mark.e2e
 class TestImportMapping:
     """Test the column mapping step."""
 
-    def test_change_mapping_dropdown(self, authenticated_page: Page, sample_csv: Path) -> None:
+    def test_change_mapping_dropdown(self, mapping_page: Page) -> None:
         """Test that column mapping dropdowns can be changed."""
-        page = authenticated_page
-        _navigate_to_import(page)
-        _upload_csv(page, sample_csv)
+        page = mapping_page
 
         first_select = page.locator(".import-mapping-select").first
         first_select.select_option("skip")
         expect(first_select).to_have_value("skip")
 
-    def test_confirm_mapping_button(self, authenticated_page: Page, sample_csv: Path) -> None:
+    def test_confirm_mapping_button(self, mapping_page: Page) -> None:
         """Test that Confirm Mapping button proceeds to results step."""
-        page = authenticated_page
-        _navigate_to_import(page)
-        _upload_csv(page, sample_csv)
+        page = mapping_page
 
         page.click("#import-confirm-mapping-btn")
 
         expect(page.locator("#import-step-results")).to_be_visible(timeout=15000)
 
 
-@pytest.mark.e2e
 class TestImportProcess:
     """Test the full import processing workflow."""
 
-    def test_full_import_workflow(self, authenticated_page: Page, sample_csv: Path) -> None:
+    def test_full_import_workflow(self, mapping_page: Page) -> None:
         """Test the complete upload -> map -> process workflow."""
-        page = authenticated_page
-        _navigate_to_import(page)
-
-        # Step 1: Upload
-        _upload_csv(page, sample_csv)
+        page = mapping_page
 
+        # Step 1: Upload (done by the mapping_page fixture)
         # Step 2: Confirm mapping (auto-suggested mappings should be fine)
         page.click("#import-confirm-mapping-btn")
         page.wait_for_selector("#import-step-results", state="visible", timeout=15000)
@@ -303,12 +293,9 @@ class TestImportProcess:
         # Should have created 2 wines (Chateau Margaux, Barolo) and skipped 2
         assert "2" in results_text
 
-    def test_import_then_reset(self, authenticated_page: Page, sample_csv: Path) -> None:
+    def test_import_then_reset(self, mapping_page: Page) -> None:
         """Test that Import Another File button resets to step 1."""
-        page = authenticated_page
-        _navigate_to_import(page)
-
-        _upload_csv(page, sample_csv)
+        page = mapping_page
         page.click("#import-confirm-mapping-btn")
         page.wait_for_selector("#import-step-results", state="visible", timeout=15000)
 
@@ -319,16 +306,12 @@ class TestImportProcess:
             expect(page.locator(".import-upload-area")).to_be_visible()
 
 
-@pytest.mark.e2e
 class TestImportCustomFields:
     """Test that custom fields from import are preserved and visible."""
 
-    def test_custom_field_in_wine_detail(self, authenticated_page: Page, sample_csv: Path) -> None:
+    def test_custom_field_in_wine_detail(self, mapping_page: Page) -> None:
         """Test that custom fields (e.g. Cellar Location) appear in wine detail."""
-        page = authenticated_page
-        _navigate_to_import(page)
-
-        _upload_csv(page, sample_csv)
+        page = mapping_page
 
         # "Cellar Location" is not a known wine field, so it's auto-mapped to "skip".
         # Change its mapping to a custom field before confirming.
@@ -1,9 +1,12 @@
 """Unit tests for import service parsing, mapping, and filtering."""
 
 import csv
+import functools
 import io
 import json
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import patch
 
 import pytest
 from openpyxl import Workbook
@@ -13,6 +16,7 @@ from winebox.services.import_service import (
     VALID_WINE_FIELDS,
     _coerce_float,
     _coerce_vintage,
+    _compile_mapping,
     _compute_custom_fields_text,
     _is_valid_mapping_value,
     _static_fallback,
@@ -49,6 +53,15 @@ def test_parse_csv_empty_rows() -> None:
     assert rows[1]["Name"] == "Wine B"
 
 
+def test_parse_csv_duplicate_headers() -> None:
+    """Test that a repeated header keeps its last column's value."""
+    content = "Name,Notes,Notes\nWine A,first,second\n,only shadowed,\n"
+    headers, rows = parse_csv(content.encode("utf-8"))
+    assert headers == ["Name", "Notes", "Notes"]
+    # The second row's only value sits in the shadowed column, so it is empty
+    assert rows == [{"Name": "Wine A", "Notes": "second"}]
+
+
 def test_parse_csv_latin1_encoding() -> None:
     """Test CSV with Latin-1 encoding (accented characters)."""
     content = "Name,Region\nChâteau Lafite,Médoc\n"
@@ -58,6 +71,22 @@ def test_parse_csv_latin1_encoding() -> None:
     assert rows[0]["Region"] == "Médoc"
 
 
+def test_parse_csv_utf8_bom() -> None:
+    """Test that a UTF-8 byte order mark is not kept in the first header."""
+    content = "\ufeffWine Name,Vintage\nBarolo,2018\n"
+    headers, rows = parse_csv(content.encode("utf-8"))
+    assert headers == ["Wine Name", "Vintage"]
+    assert rows[0]["Wine Name"] == "Barolo"
+
+
+def test_parse_csv_latin1_after_first_chunk() -> None:
+    """Test Latin-1 detection when the first non-ASCII byte is deep in the file."""
+    content = "Name,Region\n" + "Wine,Bordeaux\n" * 1000 + "Château Lafite,Médoc\n"
+    headers, rows = parse_csv(content.encode("latin-1"))
+    assert len(rows) == 1001
+    assert rows[-1]["Name"] == "Château Lafite"
+
+
 def test_parse_csv_no_headers() -> None:
     """Test error on CSV with no headers."""
     with pytest.raises(ValueError, match="no headers"):
@@ -77,8 +106,12 @@ def test_parse_csv_headers_only() -> None:
 # =============================================================================
 
 
-def _make_xlsx(headers: list[str], rows: list[list]) -> bytes:
-    """Helper to create XLSX bytes from headers and rows."""
+@functools.cache
+def _make_xlsx(headers: tuple, rows: tuple[tuple, ...]) -> bytes:
+    """Helper to create XLSX bytes from headers and rows.
+
+    Cached per distinct shape, so each workbook is serialized only once.
+    """
     wb = Workbook()
     ws = wb.active
     ws.append(headers)
@@ -92,11 +125,11 @@ def _make_xlsx(headers: list[str], rows: list[list]) -> bytes:
 def test_parse_xlsx_basic() -> None:
     """Test basic XLSX parsing."""
     content = _make_xlsx(
-        ["Wine", "Year", "Country"],
-        [
-            ["Barolo Riserva", 2017, "Italy"],
-            ["Rioja Gran Reserva", 2014, "Spain"],
-        ],
+        ("Wine", "Year", "Country"),
+        (
+            ("Barolo Riserva", 2017, "Italy"),
+            ("Rioja Gran Reserva", 2014, "Spain"),
+        ),
     )
     headers, rows = parse_xlsx(content)
     assert headers == ["Wine", "Year", "Country"]
@@ -105,6 +138,34 @@ def test_parse_xlsx_basic() -> None:
     assert rows[1]["Country"] == "Spain"
 
 
+def test_parse_xlsx_blank_header_column() -> None:
+    """Test that values stay aligned when a header cell is blank."""
+    content = _make_xlsx(
+        (None, "Name", "Year"),
+        (
+            ("ignored", "Barolo", 2017),
+            (None, None, None),
+        ),
+    )
+    headers, rows = parse_xlsx(content)
+    assert headers == ["Name", "Year"]
+    assert rows == [{"Name": "Barolo", "Year": "2017"}]
+
+
+def test_parse_xlsx_duplicate_headers() -> None:
+    """Test that a repeated header keeps its last column's value."""
+    content = _make_xlsx(
+        ("Name", "Notes", "Notes"),
+        (
+            ("Barolo", "first", "second"),
+            (None, "only shadowed", None),
+        ),
+    )
+    headers, rows = parse_xlsx(content)
+    assert headers == ["Name", "Notes", "Notes"]
+    assert rows == [{"Name": "Barolo", "Notes": "second"}]
+
+
 def test_parse_xlsx_first_sheet_only() -> None:
     """Test that only the first sheet is parsed."""
     wb = Workbook()
@@ -163,6 +224,16 @@ def test_suggest_mapping_unknown_custom() -> None:
     assert mapping["name"] == "name"
 
 
+def test_suggest_mapping_cached_result_not_shared() -> None:
+    """Test that mutating a returned mapping does not affect later calls."""
+    headers = ["Wine Name", "Vintage"]
+    first = suggest_column_mapping(headers)
+    first["Wine Name"] = "skip"
+    second = suggest_column_mapping(headers)
+    assert second["Wine Name"] == "name"
+    assert second is not first
+
+
 # =============================================================================
 # Non-Wine Filtering Tests
 # =============================================================================
@@ -244,6 +315,28 @@ def test_row_to_wine_data_no_name_returns_none() -> None:
     assert result is None
 
 
+def test_row_to_wine_data_compiled_mapping_matches_dict() -> None:
+    """Test that a precompiled mapping gives the same result as the dict."""
+    from datetime import datetime, timezone
+
+    from beanie import PydanticObjectId
+
+    row = {"Name": "Test", "Year": "2018", "ABV": "13.5%", "Qty": "3", "Bin": "A1", "Type": "Red"}
+    mapping = {
+        "Name": "name", "Year": "vintage", "ABV": "alcohol_percentage",
+        "Qty": "quantity", "Bin": "custom:Bin", "Type": "wine_type_id",
+    }
+    owner_id = PydanticObjectId()
+    now = datetime.now(timezone.utc)
+
+    compiled = _compile_mapping(mapping)
+    assert compiled.filter_headers == ("Name", "Type")
+    assert row_to_wine_data(row, compiled, owner_id, now=now) == row_to_wine_data(
+        row, mapping, owner_id, now=now
+    )
+    assert is_non_wine_row(row, compiled) is False
+
+
 def test_row_to_wine_vintage_coercion() -> None:
     """Test vintage year coercion from string."""
     from beanie import PydanticObjectId
@@ -297,6 +390,17 @@ def test_coerce_vintage_float() -> None:
     assert _coerce_vintage("2020.0") == 2020
 
 
+def test_coerce_vintage_signed_padded_and_spaced() -> None:
+    assert _coerce_vintage("+2015") == 2015
+    assert _coerce_vintage("02015") == 2015
+    assert _coerce_vintage("\t2015 ") == 2015
+
+
+def test_coerce_vintage_rejects_exponent_and_negative() -> None:
+    assert _coerce_vintage("2015e0") is None
+    assert _coerce_vintage("-2015") is None
+
+
 def test_coerce_vintage_invalid() -> None:
     assert _coerce_vintage("not_a_year") is None
 
@@ -313,6 +417,27 @@ def test_coerce_float_empty() -> None:
     assert _coerce_float("") is None
 
 
+def test_coerce_float_rejects_non_numeric() -> None:
+    assert _coerce_float(" 12 % ") == 12.0
+    assert _coerce_float(".5") == 0.5
+    assert _coerce_float("about 13") is None
+    assert _coerce_float("nan") is None
+
+
+def test_coerce_float_accepted_forms() -> None:
+    assert _coerce_float("13.5 %") == 13.5
+    assert _coerce_float("+13.5") == 13.5
+    # Comma is the decimal separator, not a thousands separator
+    assert _coerce_float(" 13,5") == 13.5
+
+
+def test_coerce_float_rejected_forms() -> None:
+    assert _coerce_float("1e1") is None
+    assert _coerce_float("1_000") is None
+    assert _coerce_float("inf") is None
+    assert _coerce_float("%13.5") is None
+
+
 def test_compute_custom_fields_text() -> None:
     result = _compute_custom_fields_text({"Location": "Rack 3", "Price": "$50"})
     assert "Location Rack 3" in result
@@ -329,15 +454,42 @@ def test_compute_custom_fields_text_none() -> None:
 # =============================================================================
 
 
-def _mock_claude_response(content: str) -> MagicMock:
-    """Build a mock Anthropic messages.create() response."""
-    message = MagicMock()
-    message.content = [MagicMock(text=content)]
-    return message
+@pytest.fixture(autouse=True)
+def _reset_ai_mapping_state():
+    """Clear the AI mapping cache and shared client so tests stay isolated."""
+    from winebox.services.import_service import mapping
+
+    mapping._ai_mapping_cache.clear()
+    mapping._anthropic_client = None
+    mapping._anthropic_client_key = None
+    yield
+    mapping._ai_mapping_cache.clear()
+    mapping._anthropic_client = None
+    mapping._anthropic_client_key = None
+
+
+def _fake_response(text: str) -> SimpleNamespace:
+    """Build a stand-in for an Anthropic messages.create() response."""
+    return SimpleNamespace(content=[SimpleNamespace(text=text)])
+
+
+class _FakeClient:
+    """Minimal stand-in for anthropic.Anthropic with a canned create() result."""
+
+    def __init__(self, response: SimpleNamespace | None = None, error: Exception | None = None):
+        self.create_calls = 0
+
+        def create(**kwargs: Any) -> SimpleNamespace | None:
+            self.create_calls += 1
+            if error is not None:
+                raise error
+            return response
+
+        self.messages = SimpleNamespace(create=create)
 
 
 @pytest.mark.asyncio
-async def test_suggest_mapping_ai_basic() -> None:
+async def test_suggest_mapping_ai_basic(monkeypatch: pytest.MonkeyPatch) -> None:
     """Test correct mapping returned from mocked Claude response."""
     headers = ["Nom du vin", "Producteur", "Millésime"]
     preview_rows = [
@@ -349,11 +501,10 @@ async def test_suggest_mapping_ai_basic() -> None:
         "Millésime": "vintage",
     })
 
-    mock_client = MagicMock()
-    mock_client.messages.create.return_value = _mock_claude_response(ai_response)
+    client = _FakeClient(_fake_response(ai_response))
+    monkeypatch.setattr("anthropic.Anthropic", lambda api_key: client)
 
-    with patch("winebox.services.import_service.mapping.settings") as mock_settings, \
-         patch("anthropic.Anthropic", return_value=mock_client):
+    with patch("winebox.services.import_service.mapping.settings") as mock_settings:
         mock_settings.anthropic_api_key = "test-key"
         result = await suggest_column_mapping_ai(headers, preview_rows)
 
@@ -363,6 +514,33 @@ async def test_suggest_mapping_ai_basic() -> None:
     assert result["Millésime"] == "vintage"
 
 
+@pytest.mark.asyncio
+async def test_suggest_mapping_ai_cached_on_repeat(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that repeating the same headers and samples skips the API call."""
+    headers = ["Nom du vin", "Millésime"]
+    preview_rows = [{"Nom du vin": "Margaux", "Millésime": "2015"}]
+    ai_response = json.dumps({"Nom du vin": "name", "Millésime": "vintage"})
+
+    client = _FakeClient(_fake_response(ai_response))
+    constructed: list[str] = []
+
+    def make_client(api_key: str) -> _FakeClient:
+        constructed.append(api_key)
+        return client
+
+    monkeypatch.setattr("anthropic.Anthropic", make_client)
+
+    with patch("winebox.services.import_service.mapping.settings") as mock_settings:
+        mock_settings.anthropic_api_key = "test-key"
+        first = await suggest_column_mapping_ai(headers, preview_rows)
+        first["Nom du vin"] = "skip"
+        second = await suggest_column_mapping_ai(headers, preview_rows)
+
+    assert second == {"Nom du vin": "name", "Millésime": "vintage"}
+    assert client.create_calls == 1
+    assert constructed == ["test-key"]
+
+
 @pytest.mark.asyncio
 async def test_suggest_mapping_ai_no_api_key() -> None:
     """Test returns None when no API key is set."""
@@ -378,16 +556,15 @@ async def test_suggest_mapping_ai_no_api_key() -> None:
 
 
 @pytest.mark.asyncio
-async def test_suggest_mapping_ai_api_error() -> None:
+async def test_suggest_mapping_ai_api_error(monkeypatch: pytest.MonkeyPatch) -> None:
     """Test returns None on API exception (graceful fallback)."""
     headers = ["Name", "Vintage"]
     preview_rows = [{"Name": "Test Wine", "Vintage": "2020"}]
 
-    mock_client = MagicMock()
-    mock_client.messages.create.side_effect = Exception("API rate limit exceeded")
+    client = _FakeClient(error=Exception("API rate limit exceeded"))
+    monkeypatch.setattr("anthropic.Anthropic", lambda api_key: client)
 
-    with patch("winebox.services.import_service.mapping.settings") as mock_settings, \
-         patch("anthropic.Anthropic", return_value=mock_client):
+    with patch("winebox.services.import_service.mapping.settings") as mock_settings:
         mock_settings.anthropic_api_key = "test-key"
         result = await suggest_column_mapping_ai(headers, preview_rows)
 
@@ -395,18 +572,15 @@ async def test_suggest_mapping_ai_api_error() -> None:
 
 
 @pytest.mark.asyncio
-async def test_suggest_mapping_ai_malformed_json() -> None:
+async def test_suggest_mapping_ai_malformed_json(monkeypatch: pytest.MonkeyPatch) -> None:
     """Test returns None when response isn't valid JSON."""
     headers = ["Name", "Vintage"]
     preview_rows = [{"Name": "Test Wine", "Vintage": "2020"}]
 
-    mock_client = MagicMock()
-    mock_client.messages.create.return_value = _mock_claude_response(
-        "I'm sorry, I can't parse that spreadsheet."
-    )
+    client = _FakeClient(_fake_response("I'm sorry, I can't parse that spreadsheet."))
+    monkeypatch.setattr("anthropic.Anthropic", lambda api_key: client)
 
-    with patch("winebox.services.import_service.mapping.settings") as mock_settings, \
-         patch("anthropic.Anthropic", return_value=mock_client):
+    with patch("winebox.services.import_service.mapping.settings") as mock_settings:
         mock_settings.anthropic_api_key = "test-key"
         result = await suggest_column_mapping_ai(headers, preview_rows)
 
@@ -414,7 +588,7 @@ async def test_suggest_mapping_ai_malformed_json() -> None:
 
 
 @pytest.mark.asyncio
-async def test_suggest_mapping_ai_invalid_field_dropped() -> None:
+async def test_suggest_mapping_ai_invalid_field_dropped(monkeypatch: pytest.MonkeyPatch) -> None:
     """Test that invalid field values fall back to static per-header."""
     headers = ["Wine Name", "Bogus Column"]
     preview_rows = [{"Wine Name": "Margaux", "Bogus Column": "xyz"}]
@@ -423,11 +597,10 @@ async def test_suggest_mapping_ai_invalid_field_dropped() -> None:
         "Bogus Column": "nonexistent_field",  # Invalid field
     })
 
-    mock_client = MagicMock()
-    mock_client.messages.create.return_value = _mock_claude_response(ai_response)
+    client = _FakeClient(_fake_response(ai_response))
+    monkeypatch.setattr("anthropic.Anthropic", lambda api_key: client)
 
-    with patch("winebox.services.import_service.mapping.settings") as mock_settings, \
-         patch("anthropic.Anthropic", return_value=mock_client):
+    with patch("winebox.services.import_service.mapping.settings") as mock_settings:
         mock_settings.anthropic_api_key = "test-key"
         result = await suggest_column_mapping_ai(headers, preview_rows)
 
@@ -438,18 +611,17 @@ async def test_suggest_mapping_ai_invalid_field_dropped() -> None:
 
 
 @pytest.mark.asyncio
-async def test_suggest_mapping_ai_markdown_code_block() -> None:
+async def test_suggest_mapping_ai_markdown_code_block(monkeypatch: pytest.MonkeyPatch) -> None:
     """Test handling of JSON wrapped in markdown code blocks."""
     headers = ["Vintge", "Région"]
     preview_rows = [{"Vintge": "2018", "Région": "Bordeaux"}]
     ai_json = json.dumps({"Vintge": "vintage", "Région": "region"})
     wrapped = f"```json\n{ai_json}\n```"
 
-    mock_client = MagicMock()
-    mock_client.messages.create.return_value = _mock_claude_response(wrapped)
+    client = _FakeClient(_fake_response(wrapped))
+    monkeypatch.setattr("anthropic.Anthropic", lambda api_key: client)
 
-    with patch("winebox.services.import_service.mapping.settings") as mock_settings, \
-         patch("anthropic.Anthropic", return_value=mock_client):
+    with patch("winebox.services.import_service.mapping.settings") as mock_settings:
         mock_settings.anthropic_api_key = "test-key"
         result = await suggest_column_mapping_ai(headers, preview_rows)
 
@@ -470,6 +642,13 @@ def test_static_fallback_known_alias() -> None:
     assert _static_fallback("VINTAGE") == "vintage"
 
 
+def test_static_fallback_normalizes_header() -> None:
+    """Test _static_fallback strips and case-folds headers, including accents."""
+    assert _static_fallback("  Country of Origin ") == "country"
+    assert _static_fallback("CÉPAGE") == "grape_variety"
+    assert _static_fallback("CHÂTEAU") == "winery"
+
+
 def test_static_fallback_unknown() -> None:
     """Test _static_fallback returns custom field for unknown header."""
     assert _static_fallback("My Custom Column") == "custom:My Custom Column"
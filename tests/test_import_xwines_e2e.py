@@ -8,17 +8,25 @@ These tests require a running WineBox server. Start the server with:
 
 Run with:
     WINEBOX_USE_CLAUDE_VISION=false uv run python -m pytest -m e2e tests/test_import_xwines_e2e.py -v
+
+The mapping-page and full-import tests live in separate classes so they can
+run on different xdist workers (``-n 2 --dist=loadscope``). Each worker logs
+in as its own user, and the server scopes all wine data by owner, so workers
+never see each other's imports.
 """
 
 import csv
 import os
 import subprocess
+import sys
 import time
 from pathlib import Path
 from typing import Generator
 
 import pytest
-from playwright.sync_api import Page, expect
+from playwright.sync_api import Browser, Page, expect
+
+from tests.conftest import add_user_in_process
 
 # Server URL - can be overridden with WINEBOX_TEST_URL env var
 BASE_URL = os.environ.get("WINEBOX_TEST_URL", "http://localhost:8000")
@@ -72,6 +80,9 @@ AUTO_MAPPED = {
     "Colour": "wine_type_id",
 }
 
+# Columns with few distinct values across the 5000 rows (interned on load)
+LOW_CARDINALITY_COLUMNS = frozenset({"Country", "Region", "Colour"})
+
 # Columns expected to default to custom fields (not auto-mapped)
 EXPECTED_CUSTOM = [
     "Parent ID",
@@ -115,11 +126,24 @@ def _get_worker_id(request: pytest.FixtureRequest) -> str:
 
 
 def _load_csv_data(csv_path: Path) -> tuple[list[str], list[dict[str, str]]]:
-    """Load headers and all rows from a CSV file."""
+    """Load headers and all rows from a CSV file.
+
+    Uses csv.reader and zips each row against the headers, which avoids
+    DictReader's per-row bookkeeping. Values in LOW_CARDINALITY_COLUMNS are
+    interned so the 5000 rows share one string object per distinct value.
+    """
     with open(csv_path, newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        headers = list(reader.fieldnames or [])
-        rows = list(reader)
+        reader = csv.reader(f)
+        headers = next(reader, [])
+        interned = [i for i, h in enumerate(headers) if h in LOW_CARDINALITY_COLUMNS]
+        rows = []
+        for row in reader:
+            if not row:
+                continue
+            for i in interned:
+                if i < len(row):
+                    row[i] = sys.intern(row[i])
+            rows.append(dict(zip(headers, row)))
     return headers, rows
 
 
@@ -169,60 +193,73 @@ def xwines_csv_data(xwines_csv_path: Path) -> tuple[list[str], list[dict[str, st
     return _load_csv_data(xwines_csv_path)
 
 
+def _add_user_subprocess(email: str, password: str) -> None:
+    """Create a user by shelling out to ``uv run winebox-admin add``.
+
+    Raises:
+        RuntimeError: If the command fails for a reason other than the
+            email already being registered.
+    """
+    result = subprocess.run(
+        ["uv", "run", "winebox-admin", "add", email, "--password", password],
+        cwd=PROJECT_DIR,
+        capture_output=True,
+        timeout=30,
+        text=True,
+    )
+    combined_output = result.stdout + result.stderr
+    if result.returncode != 0 and "already in use" not in combined_output:
+        raise RuntimeError(f"stdout: {result.stdout}\nstderr: {result.stderr}")
+
+
 @pytest.fixture(scope="session")
 def worker_user(
     request: pytest.FixtureRequest,
 ) -> Generator[tuple[str, str], None, None]:
-    """Create a test user for this worker session."""
+    """Create a test user for this worker session.
+
+    The user is created in-process; set WINEBOX_E2E_FORCE_SUBPROCESS=1 to go
+    through the winebox-admin CLI instead when debugging.
+    """
     worker_id = _get_worker_id(request)
     email = f"e2e_xwines_{worker_id}@test.example.com"
     password = "testpass123"
 
+    if os.environ.get("WINEBOX_E2E_FORCE_SUBPROCESS"):
+        create_user = _add_user_subprocess
+    else:
+        create_user = add_user_in_process
+
     max_retries = 3
-    created = False
-    result = None
     for attempt in range(max_retries):
-        result = subprocess.run(
-            ["uv", "run", "winebox-admin", "add", email, "--password", password],
-            cwd=PROJECT_DIR,
-            capture_output=True,
-            timeout=30,
-            text=True,
-        )
-        combined_output = result.stdout + result.stderr
-        if result.returncode == 0 or "already exists" in combined_output or "already in use" in combined_output:
-            created = True
+        try:
+            create_user(email, password)
             break
-        if attempt < max_retries - 1:
-            time.sleep(1.0)
-
-    if not created:
-        import sys
-
-        print(f"WARNING: Failed to create user {email}", file=sys.stderr)
-        if result:
-            print(f"  stdout: {result.stdout}", file=sys.stderr)
-            print(f"  stderr: {result.stderr}", file=sys.stderr)
+        except Exception as e:
+            if attempt < max_retries - 1:
+                time.sleep(1.0)
+            else:
+                print(f"WARNING: Failed to create user {email}: {e}", file=sys.stderr)
 
-    time.sleep(0.5)
     yield email, password
 
 
-@pytest.fixture(scope="function")
-def test_user(worker_user: tuple[str, str]) -> tuple[str, str]:
-    """Return the worker's test user credentials."""
-    return worker_user
-
+@pytest.fixture(scope="class")
+def authenticated_page(
+    browser: Browser,
+    browser_context_args: dict,
+    worker_user: tuple[str, str],
+) -> Generator[Page, None, None]:
+    """Log in once per test class and share the page across its tests.
 
-@pytest.fixture(scope="function")
-def authenticated_page(page: Page, test_user: tuple[str, str]) -> Page:
-    """Log in and return an authenticated page."""
-    email, password = test_user
+    Uses its own browser context (pytest-playwright's page fixture is
+    function-scoped), so the login round-trip is paid once per class.
+    """
+    email, password = worker_user
+    context = browser.new_context(**browser_context_args)
+    page = context.new_page()
 
-    page.context.clear_cookies()
     page.goto(BASE_URL)
-    page.evaluate("localStorage.clear()")
-    page.reload()
 
     page.wait_for_selector("#login-form", state="visible", timeout=10000)
     page.fill("#login-email", email)
@@ -235,10 +272,57 @@ def authenticated_page(page: Page, test_user: tuple[str, str]) -> Page:
         error_elem = page.locator("#login-error")
         if error_elem.is_visible():
             error_text = error_elem.text_content()
+            context.close()
             raise AssertionError(f"Login failed for user '{email}': {error_text}")
+        context.close()
         raise
 
-    return page
+    yield page
+
+    context.close()
+
+
+@pytest.fixture(scope="class")
+def imported_cellar(authenticated_page: Page, xwines_csv_path: Path) -> tuple[int, int]:
+    """Run the full 5000-row UI import once per class.
+
+    Returns:
+        (wines_created, rows_skipped) as shown on the results step.
+    """
+    page = authenticated_page
+    _navigate_to_import(page)
+    _upload_and_remap(page, xwines_csv_path)
+
+    # Click confirm and wait for results (180s for 5000 inserts)
+    page.click("#import-confirm-mapping-btn")
+    page.wait_for_selector(
+        "#import-step-results", state="visible", timeout=180000
+    )
+
+    # Extract result statistics (scoped to results step to avoid dashboard stats)
+    stat_values = page.locator("#import-step-results .stat-value").all()
+    assert len(stat_values) >= 2, "Expected at least 2 stat values in results"
+
+    wines_created_text = stat_values[0].text_content() or "0"
+    rows_skipped_text = stat_values[1].text_content() or "0"
+    return (
+        int(wines_created_text.replace(",", "")),
+        int(rows_skipped_text.replace(",", "")),
+    )
+
+
+@pytest.fixture(autouse=True)
+def reset_page(request: pytest.FixtureRequest) -> None:
+    """Reload the shared page before each test so no UI state carries over.
+
+    The JWT stays in localStorage, so the reload lands back on the main view
+    without logging in again.
+    """
+    if "authenticated_page" not in request.fixturenames:
+        return
+    page: Page = request.getfixturevalue("authenticated_page")
+    page.goto(BASE_URL)
+    page.wait_for_selector("#main-content", state="visible", timeout=15000)
 
 
 # ---------------------------------------------------------------------------
@@ -247,8 +331,8 @@ def authenticated_page(page: Page, test_user: tuple[str, str]) -> Page:
 
 
 @pytest.mark.e2e
-class TestXWinesImport:
-    """Tests for importing the X-Wines 5000-row CSV and validating UI output."""
+class TestXWinesMapping:
+    """Tests for the upload and column mapping steps (no rows are imported)."""
 
     def test_upload_shows_correct_headers(
         self,
@@ -320,37 +404,25 @@ class TestXWinesImport:
             expect(custom_input).to_be_visible()
             expect(custom_input).to_have_value(header)
 
+
+@pytest.mark.e2e
+class TestXWinesImport:
+    """Tests for importing the X-Wines 5000-row CSV and validating UI output."""
+
     def test_full_import_and_cellar_validation(
         self,
         authenticated_page: Page,
-        xwines_csv_path: Path,
+        imported_cellar: tuple[int, int],
         xwines_csv_data: tuple[list[str], list[dict[str, str]]],
     ) -> None:
         """Import all 5000 rows and validate against cellar display."""
         page = authenticated_page
         _, rows = xwines_csv_data
+        wines_created, rows_skipped = imported_cellar
 
         # Build a set of Description values from the CSV for validation
         csv_descriptions = {row["Description"] for row in rows if row["Description"].strip()}
 
-        _navigate_to_import(page)
-        _upload_and_remap(page, xwines_csv_path)
-
-        # Click confirm and wait for results (180s for 5000 inserts)
-        page.click("#import-confirm-mapping-btn")
-        page.wait_for_selector(
-            "#import-step-results", state="visible", timeout=180000
-        )
-
-        # Extract result statistics (scoped to results step to avoid dashboard stats)
-        stat_values = page.locator("#import-step-results .stat-value").all()
-        assert len(stat_values) >= 2, "Expected at least 2 stat values in results"
-
-        wines_created_text = stat_values[0].text_content() or "0"
-        rows_skipped_text = stat_values[1].text_content() or "0"
-        wines_created = int(wines_created_text.replace(",", ""))
-        rows_skipped = int(rows_skipped_text.replace(",", ""))
-
         # Verify wines_created is close to 5000
         assert wines_created > 4500, (
             f"Expected > 4500 wines created, got {wines_created}"
@@ -366,13 +438,14 @@ class TestXWinesImport:
         page.wait_for_selector("#page-cellar", state="visible")
         page.wait_for_selector(".wine-card", state="visible", timeout=15000)
 
-        # Collect displayed wine card titles
-        wine_cards = page.locator(".wine-card-title").all()
-        assert len(wine_cards) > 0, "No wine cards found in cellar"
+        # Collect the first 20 displayed wine card titles in one round-trip
+        card_names: list[str] = page.locator(".wine-card-title").evaluate_all(
+            "els => els.slice(0, 20).map(e => (e.textContent || '').trim())"
+        )
+        assert len(card_names) > 0, "No wine cards found in cellar"
 
         # Verify each displayed wine name exists in the CSV descriptions
-        for card in wine_cards[:20]:  # Check first 20 cards
-            card_name = (card.text_content() or "").strip()
+        for card_name in card_names:
             assert card_name in csv_descriptions, (
                 f"Wine card title '{card_name}' not found in CSV Description column"
             )
@@ -385,7 +458,7 @@ class TestXWinesImport:
         modal_text = modal.text_content() or ""
 
         # Get the first wine card's name for matching
-        first_wine_name = (wine_cards[0].text_content() or "").strip()
+        first_wine_name = card_names[0]
         assert first_wine_name in modal_text, (
             f"Modal should contain wine name '{first_wine_name}'"
         )
@@ -428,23 +501,10 @@ class TestXWinesImport:
     def test_import_preserves_country_distribution(
         self,
         authenticated_page: Page,
-        xwines_csv_path: Path,
-        xwines_csv_data: tuple[list[str], list[dict[str, str]]],
+        imported_cellar: tuple[int, int],
     ) -> None:
         """Verify that imported wines span multiple distinct countries."""
         page = authenticated_page
-        _, rows = xwines_csv_data
-
-        # Count distinct countries in the CSV
-        csv_countries = {row["Country"] for row in rows if row["Country"].strip()}
-
-        _navigate_to_import(page)
-        _upload_and_remap(page, xwines_csv_path)
-
-        page.click("#import-confirm-mapping-btn")
-        page.wait_for_selector(
-            "#import-step-results", state="visible", timeout=180000
-        )
 
         # Use the API to check imported wines (must use fetchWithAuth for auth)
         api_result = page.evaluate(
@@ -1,8 +1,14 @@
 """Tests for OCR and wine parsing services."""
 
+from datetime import date
+
 import pytest
+from PIL import Image
 
+from winebox.services.ocr import OCR_MAX_DIMENSION, _prepare_image
 from winebox.services.wine_parser import WineParserService
+from winebox.services.wine_parser import parser as parser_module
+from winebox.services.wine_parser.extractors import extract_country
 
 
 class TestWineParserService:
@@ -139,6 +145,59 @@ class TestWineParserService:
         result = self.parser.parse("Wine 2030")
         assert result.get("vintage") is None
 
+    def test_parse_vintage_follows_current_year(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a cached parse is redone once the year changes."""
+        class FakeDate(date):
+            year_now = 2020
+
+            @classmethod
+            def today(cls) -> "FakeDate":
+                return cls(cls.year_now, 1, 1)
+
+        monkeypatch.setattr(parser_module, "date", FakeDate)
+
+        # Next year's vintage is accepted...
+        assert self.parser.parse("Bottled 2021").get("vintage") == 2021
+
+        # ...but a year earlier it is still in the future, cached or not
+        FakeDate.year_now = 2019
+        assert self.parser.parse("Bottled 2021").get("vintage") is None
+
+    def test_country_region_argument(self) -> None:
+        """Test that a passed region, even None, replaces the region scan."""
+        text = "napa valley reserve"
+        assert extract_country(text) == "United States"
+        assert extract_country(text, "Bordeaux") == "France"
+        # The caller already found no region, so none is looked up again
+        assert extract_country(text, None) is None
+
+    def test_parse_grape_blend(self) -> None:
+        """Test parsing grape blends with percentages on either side."""
+        result = self.parser.parse("Cabernet Sauvignon 60%, Merlot 40%")
+        assert result.get("grape_varieties") == [
+            {"name": "Cabernet Sauvignon", "percentage": 60},
+            {"name": "Merlot", "percentage": 40},
+        ]
+
+    def test_parse_grape_blend_long_text(self) -> None:
+        """Test a long run of words without a blend percentage still parses."""
+        text = "Grand Vin de Bordeaux " * 400 + "Merlot 40%"
+        result = self.parser.parse(text)
+        assert result.get("grape_varieties") == [{"name": "Merlot", "percentage": 40}]
+
+    def test_parse_result_not_shared_between_calls(self) -> None:
+        """Test that mutating a parse result doesn't leak into the cached one."""
+        text = "Cabernet Sauvignon 60%, Merlot 40%"
+        first = self.parser.parse(text)
+        first["grape_varieties"][0]["percentage"] = 99
+        first["vintage"] = 1999
+
+        second = self.parser.parse(text)
+        assert second["grape_varieties"][0]["percentage"] == 60
+        assert "vintage" not in second
+
     def test_parse_handles_malformed_text(self) -> None:
         """Test parsing handles malformed OCR text gracefully."""
         text = "W1ne N@me 2O19 C@bernet"  # OCR errors
@@ -159,3 +218,20 @@ class TestWineParserService:
             result = self.parser.parse(text)
             if expected_country:
                 assert result.get("country") == expected_country
+
+
+class TestOCRPreprocessing:
+    """Tests for image preparation before OCR."""
+
+    def test_large_image_downscaled(self) -> None:
+        """Test oversized photos are shrunk to the OCR size limit."""
+        image = Image.new("RGB", (4000, 3000), "white")
+        prepared = _prepare_image(image)
+        assert prepared.size == (OCR_MAX_DIMENSION, 1350)
+        assert prepared.mode == "L"
+        assert image.size == (4000, 3000)
+
+    def test_small_image_kept(self) -> None:
+        """Test images within the limit keep their size."""
+        prepared = _prepare_image(Image.new("RGB", (800, 600), "white"))
+        assert prepared.size == (800, 600)
@@ -1,19 +1,30 @@
 """Tests for sub_region, appellation, and classification fields."""
 
-import io
+import asyncio
 
 import pytest
 from httpx import AsyncClient
 
+from tests.conftest import label_files
+from winebox.services.ocr import OCRService
+
+
+@pytest.fixture(autouse=True)
+def no_ocr(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Skip Tesseract: these tests cover the region fields, not OCR output."""
+    async def extract_nothing(self: OCRService, image: object) -> str:
+        return ""
+
+    monkeypatch.setattr(OCRService, "extract_text", extract_nothing)
+    monkeypatch.setattr(OCRService, "extract_text_from_bytes", extract_nothing)
+
 
 @pytest.mark.asyncio
 async def test_checkin_with_region_fields(
     client: AsyncClient, sample_image_bytes: bytes
 ) -> None:
     """Test checking in a wine with sub_region, appellation, and classification."""
-    files = {
-        "front_label": ("test.png", io.BytesIO(sample_image_bytes), "image/png"),
-    }
+    files = label_files(sample_image_bytes)
     data = {
         "name": "Clos de Vougeot",
         "winery": "Domaine Leroy",
@@ -43,9 +54,7 @@ async def test_checkin_without_region_fields(
     client: AsyncClient, sample_image_bytes: bytes
 ) -> None:
     """Test that new fields default to None when not provided."""
-    files = {
-        "front_label": ("test.png", io.BytesIO(sample_image_bytes), "image/png"),
-    }
+    files = label_files(sample_image_bytes)
     data = {
         "name": "Simple Wine",
         "quantity": "1",
@@ -66,9 +75,7 @@ async def test_wine_detail_includes_region_fields(
     client: AsyncClient, sample_image_bytes: bytes
 ) -> None:
     """Test that wine detail response includes the new fields."""
-    files = {
-        "front_label": ("test.png", io.BytesIO(sample_image_bytes), "image/png"),
-    }
+    files = label_files(sample_image_bytes)
     data = {
         "name": "Barolo Riserva",
         "region": "Piedmont",
@@ -101,9 +108,7 @@ async def test_update_wine_region_fields(
 ) -> None:
     """Test updating wine with new region fields via PUT."""
     # Create a wine first
-    files = {
-        "front_label": ("test.png", io.BytesIO(sample_image_bytes), "image/png"),
-    }
+    files = label_files(sample_image_bytes)
     data = {
         "name": "Test Update Wine",
         "region": "Bordeaux",
@@ -134,47 +139,49 @@ async def test_update_wine_region_fields(
 
 
 @pytest.mark.asyncio
-async def test_search_by_sub_region(
+async def test_search_by_sub_region_and_appellation(
     client: AsyncClient, sample_image_bytes: bytes
 ) -> None:
-    """Test that search finds wines by sub_region."""
-    files = {
-        "front_label": ("test.png", io.BytesIO(sample_image_bytes), "image/png"),
-    }
-    data = {
-        "name": "Gevrey-Chambertin Wine",
-        "sub_region": "Côte de Nuits",
-        "quantity": "1",
-    }
-    await client.post("/api/wines/checkin", files=files, data=data)
+    """Test that search finds wines by sub_region and by appellation."""
+    seed_data = [
+        {
+            "name": "Gevrey-Chambertin Wine",
+            "sub_region": "Côte de Nuits",
+            "quantity": "1",
+        },
+        {
+            "name": "Pomerol Treasure",
+            "appellation": "Pomerol",
+            "quantity": "1",
+        },
+    ]
+
+    # The two check-ins are independent, so seed them concurrently
+    checkin_responses = await asyncio.gather(
+        *(
+            client.post(
+                "/api/wines/checkin",
+                files=label_files(sample_image_bytes),
+                data=data,
+            )
+            for data in seed_data
+        )
+    )
+    assert all(r.status_code == 201 for r in checkin_responses)
 
-    # Search by sub_region text
-    response = await client.get("/api/search?q=Côte de Nuits")
-    assert response.status_code == 200
-    wines = response.json()
+    # Search by sub_region and appellation text
+    sub_region_response, appellation_response = await asyncio.gather(
+        client.get("/api/search?q=Côte de Nuits"),
+        client.get("/api/search?q=Pomerol"),
+    )
+
+    assert sub_region_response.status_code == 200
+    wines = sub_region_response.json()
     assert len(wines) >= 1
     assert any(w["sub_region"] == "Côte de Nuits" for w in wines)
 
-
-@pytest.mark.asyncio
-async def test_search_by_appellation(
-    client: AsyncClient, sample_image_bytes: bytes
-) -> None:
-    """Test that search finds wines by appellation."""
-    files = {
-        "front_label": ("test.png", io.BytesIO(sample_image_bytes), "image/png"),
-    }
-    data = {
-        "name": "Pomerol Treasure",
-        "appellation": "Pomerol",
-        "quantity": "1",
-    }
-    await client.post("/api/wines/checkin", files=files, data=data)
-
-    # Search by appellation text
-    response = await client.get("/api/search?q=Pomerol")
-    assert response.status_code == 200
-    wines = response.json()
+    assert appellation_response.status_code == 200
+    wines = appellation_response.json()
     assert len(wines) >= 1
     assert any(w["appellation"] == "Pomerol" for w in wines)
 
@@ -184,9 +191,7 @@ async def test_scan_response_includes_region_fields(
     client: AsyncClient, sample_image_bytes: bytes
 ) -> None:
     """Test that scan response includes sub_region, appellation, and classification keys."""
-    files = {
-        "front_label": ("test.png", io.BytesIO(sample_image_bytes), "image/png"),
-    }
+    files = label_files(sample_image_bytes)
 
     response = await client.post("/api/wines/scan", files=files)
     assert response.status_code == 200
@@ -1,12 +1,12 @@
 """Tests for search endpoints."""
 
-import io
-
 import pytest
+import pytest_asyncio
 from httpx import AsyncClient
 
+from tests.conftest import seed_wines
+
 
-@pytest.mark.asyncio
 async def test_search_empty(client: AsyncClient) -> None:
     """Test search with no wines."""
     response = await client.get("/api/search")
@@ -14,117 +14,70 @@ async def test_search_empty(client: AsyncClient) -> None:
     assert response.json() == []
 
 
-@pytest.mark.asyncio
-async def test_search_by_text(client: AsyncClient, sample_image_bytes: bytes) -> None:
-    """Test full-text search."""
-    # Check in wines
-    for name in ["Chateau Margaux", "Opus One", "Silver Oak"]:
-        files = {
-            "front_label": ("test.png", io.BytesIO(sample_image_bytes), "image/png"),
-        }
-        data = {"name": name, "quantity": "1"}
-        await client.post("/api/wines/checkin", files=files, data=data)
-
-    # Search for "Chateau"
-    response = await client.get("/api/search?q=Chateau")
-    assert response.status_code == 200
-    wines = response.json()
-    assert len(wines) == 1
-    assert wines[0]["name"] == "Chateau Margaux"
-
-
-@pytest.mark.asyncio
-async def test_search_by_vintage(client: AsyncClient, sample_image_bytes: bytes) -> None:
-    """Test search by vintage year."""
-    # Check in wines with different vintages
-    for vintage in [2018, 2019, 2020]:
-        files = {
-            "front_label": ("test.png", io.BytesIO(sample_image_bytes), "image/png"),
-        }
-        data = {"name": f"Wine {vintage}", "vintage": str(vintage), "quantity": "1"}
-        await client.post("/api/wines/checkin", files=files, data=data)
-
-    # Search for 2019 vintage
-    response = await client.get("/api/search?vintage=2019")
-    assert response.status_code == 200
-    wines = response.json()
-    assert len(wines) == 1
-    assert wines[0]["vintage"] == 2019
-
-
-@pytest.mark.asyncio
-async def test_search_by_grape(client: AsyncClient, sample_image_bytes: bytes) -> None:
-    """Test search by grape variety."""
-    # Check in wines with different grapes
-    grapes = ["Cabernet Sauvignon", "Merlot", "Pinot Noir"]
-    for i, grape in enumerate(grapes):
-        files = {
-            "front_label": ("test.png", io.BytesIO(sample_image_bytes), "image/png"),
-        }
-        data = {"name": f"Wine {i}", "grape_variety": grape, "quantity": "1"}
-        await client.post("/api/wines/checkin", files=files, data=data)
-
-    # Search for Cabernet
-    response = await client.get("/api/search?grape=Cabernet")
-    assert response.status_code == 200
-    wines = response.json()
-    assert len(wines) == 1
-    assert wines[0]["grape_variety"] == "Cabernet Sauvignon"
-
-
-@pytest.mark.asyncio
-async def test_search_by_region(client: AsyncClient, sample_image_bytes: bytes) -> None:
-    """Test search by wine region."""
-    # Check in wines from different regions
-    files = {
-        "front_label": ("test.png", io.BytesIO(sample_image_bytes), "image/png"),
-    }
-    data = {"name": "Test Wine", "region": "Napa Valley", "quantity": "1"}
-    await client.post("/api/wines/checkin", files=files, data=data)
-
-    # Search for Napa
-    response = await client.get("/api/search?region=Napa")
-    assert response.status_code == 200
-    wines = response.json()
-    assert len(wines) == 1
-    assert wines[0]["region"] == "Napa Valley"
-
-
-@pytest.mark.asyncio
-async def test_search_by_country(client: AsyncClient, sample_image_bytes: bytes) -> None:
-    """Test search by country."""
-    # Check in wines from different countries
-    countries = ["France", "Italy", "United States"]
-    for i, country in enumerate(countries):
-        files = {
-            "front_label": ("test.png", io.BytesIO(sample_image_bytes), "image/png"),
-        }
-        data = {"name": f"Wine {i}", "country": country, "quantity": "1"}
-        await client.post("/api/wines/checkin", files=files, data=data)
-
-    # Search for France
-    response = await client.get("/api/search?country=France")
+# One wine per row; each search below should match exactly one of them
+SEARCH_WINES = [
+    {
+        "name": "Chateau Margaux",
+        "vintage": 2018,
+        "grape_variety": "Merlot",
+        "region": "Bordeaux",
+        "country": "France",
+        "quantity": 1,
+    },
+    {
+        "name": "Opus One",
+        "vintage": 2019,
+        "grape_variety": "Cabernet Sauvignon",
+        "region": "Napa Valley",
+        "country": "United States",
+        "quantity": 1,
+    },
+    {
+        "name": "Silver Oak",
+        "vintage": 2020,
+        "grape_variety": "Pinot Noir",
+        "region": "Tuscany",
+        "country": "Italy",
+        "quantity": 1,
+    },
+]
+
+
+@pytest_asyncio.fixture
+async def search_wines(client: AsyncClient) -> None:
+    """Seed SEARCH_WINES for the client fixture's user."""
+    await seed_wines(SEARCH_WINES)
+
+
+@pytest.mark.parametrize(
+    ("query", "expected_name"),
+    [
+        ("q=Chateau", "Chateau Margaux"),
+        ("vintage=2019", "Opus One"),
+        ("grape=Cabernet", "Opus One"),
+        ("region=Napa", "Opus One"),
+        ("country=France", "Chateau Margaux"),
+    ],
+    ids=["text", "vintage", "grape", "region", "country"],
+)
+async def test_search_single_filter(
+    client: AsyncClient, search_wines: None, query: str, expected_name: str
+) -> None:
+    """Test full-text search and each single-field filter."""
+    response = await client.get(f"/api/search?{query}")
     assert response.status_code == 200
     wines = response.json()
     assert len(wines) == 1
-    assert wines[0]["country"] == "France"
+    assert wines[0]["name"] == expected_name
 
 
-@pytest.mark.asyncio
-async def test_search_in_stock_filter(client: AsyncClient, sample_image_bytes: bytes) -> None:
+async def test_search_in_stock_filter(client: AsyncClient) -> None:
     """Test search with in_stock filter."""
-    # Check in two wines
-    for i in range(2):
-        files = {
-            "front_label": ("test.png", io.BytesIO(sample_image_bytes), "image/png"),
-        }
-        data = {"name": f"Wine {i}", "quantity": "2"}
-        await client.post("/api/wines/checkin", files=files, data=data)
-
-    # Check out all of first wine
-    list_response = await client.get("/api/wines")
-    wine_id = list_response.json()[0]["id"]
-    await client.post(f"/api/wines/{wine_id}/checkout", data={"quantity": "2"})
+    # One wine fully checked out, one still in stock
+    await seed_wines([
+        {"name": "Wine 0", "quantity": 0},
+        {"name": "Wine 1", "quantity": 2},
+    ])
 
     # Search for in stock only
     response = await client.get("/api/search?in_stock=true")
@@ -134,21 +87,13 @@ async def test_search_in_stock_filter(client: AsyncClient, sample_image_bytes: b
     assert wines[0]["inventory"]["quantity"] > 0
 
 
-@pytest.mark.asyncio
-async def test_search_combined_filters(client: AsyncClient, sample_image_bytes: bytes) -> None:
+async def test_search_combined_filters(client: AsyncClient) -> None:
     """Test search with multiple filters."""
-    # Check in wines
-    data_sets = [
-        {"name": "Wine A", "vintage": "2019", "country": "France"},
-        {"name": "Wine B", "vintage": "2019", "country": "Italy"},
-        {"name": "Wine C", "vintage": "2020", "country": "France"},
-    ]
-    for data in data_sets:
-        files = {
-            "front_label": ("test.png", io.BytesIO(sample_image_bytes), "image/png"),
-        }
-        data["quantity"] = "1"
-        await client.post("/api/wines/checkin", files=files, data=data)
+    await seed_wines([
+        {"name": "Wine A", "vintage": 2019, "country": "France"},
+        {"name": "Wine B", "vintage": 2019, "country": "Italy"},
+        {"name": "Wine C", "vintage": 2020, "country": "France"},
+    ])
 
     # Search for 2019 French wine
     response = await client.get("/api/search?vintage=2019&country=France")
@@ -12,12 +12,19 @@ from pathlib import Path
 import pytest
 
 APP_JS = Path(__file__).parent.parent / "winebox" / "static" / "js" / "app.js"
+STYLE_CSS = Path(__file__).parent.parent / "winebox" / "static" / "css" / "style.css"
 
 
 @pytest.fixture(scope="module")
 def app_js_source() -> str:
     """Read the app.js source once for all tests in this module."""
-    return APP_JS.read_text()
+    return APP_JS.read_text(encoding="utf-8")
+
+
+@pytest.fixture(scope="module")
+def css_source() -> str:
+    """Read the style.css source once for all tests in this module."""
+    return STYLE_CSS.read_text(encoding="utf-8")
 
 
 def test_cellar_table_view_removes_wine_grid_class(app_js_source: str) -> None:
@@ -43,10 +50,8 @@ def test_xwines_table_view_removes_wine_grid_class(app_js_source: str) -> None:
     )
 
 
-def test_wine_table_has_full_width_css() -> None:
+def test_wine_table_has_full_width_css(css_source: str) -> None:
     """The .wine-table CSS must set width: 100% for proper table display."""
-    css_path = Path(__file__).parent.parent / "winebox" / "static" / "css" / "style.css"
-    css_source = css_path.read_text()
     # Verify the table has width: 100%
     assert ".wine-table" in css_source
     assert "width: 100%" in css_source
@@ -1,14 +1,19 @@
 """Tests for wine ownership and data isolation between users."""
 
-import io
-from datetime import datetime
+import asyncio
+from datetime import datetime, timezone
 
-import pytest
 import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
 
+from tests.conftest import (
+    cached_password_hash,
+    get_test_app,
+    label_files,
+    seed_wines,
+)
 from winebox.models import User
-from winebox.services.auth import create_access_token, get_password_hash
+from winebox.services.auth import create_access_token
 
 
 @pytest_asyncio.fixture(scope="function")
@@ -17,73 +22,49 @@ async def two_users_clients(init_test_db):
 
     Returns a tuple of (user1_client, user2_client).
     """
-    from tests.conftest import get_test_app
-
-    # Create user 1
-    user1 = User(
-        email="user1@example.com",
-        hashed_password=get_password_hash("password1"),
-        is_active=True,
-        is_verified=True,
-        is_superuser=False,
-        created_at=datetime.utcnow(),
-        updated_at=datetime.utcnow(),
-    )
-    await user1.insert()
-    token1 = create_access_token(data={"sub": "user1@example.com"})
-
-    # Create user 2
-    user2 = User(
-        email="user2@example.com",
-        hashed_password=get_password_hash("password2"),
-        is_active=True,
-        is_verified=True,
-        is_superuser=False,
-        created_at=datetime.utcnow(),
-        updated_at=datetime.utcnow(),
-    )
-    await user2.insert()
-    token2 = create_access_token(data={"sub": "user2@example.com"})
-
-    app = get_test_app()
-
-    # Create clients for both users
+    now = datetime.now(timezone.utc)
+
+    # Create both users in a single round trip
+    users = [
+        User(
+            email=f"user{n}@example.com",
+            hashed_password=cached_password_hash(f"password{n}"),
+            is_active=True,
+            is_verified=True,
+            is_superuser=False,
+            created_at=now,
+            updated_at=now,
+        )
+        for n in (1, 2)
+    ]
+    await User.insert_many(users)
+    token1, token2 = (create_access_token(data={"sub": user.email}) for user in users)
+
+    # Both clients drive the shared test app through one transport
+    transport = ASGITransport(app=get_test_app())
     async with AsyncClient(
-        transport=ASGITransport(app=app),
+        transport=transport,
         base_url="http://test",
         headers={"Authorization": f"Bearer {token1}"},
-    ) as client1:
-        async with AsyncClient(
-            transport=ASGITransport(app=app),
-            base_url="http://test",
-            headers={"Authorization": f"Bearer {token2}"},
-        ) as client2:
-            yield client1, client2
-
-
-@pytest.fixture
-def sample_image_bytes() -> bytes:
-    """Create sample image bytes for testing."""
-    # Minimal valid PNG (1x1 pixel)
-    png_data = bytes([
-        0x89, 0x50, 0x4E, 0x47, 0x0D, 0x0A, 0x1A, 0x0A,
-        0x00, 0x00, 0x00, 0x0D,
-        0x49, 0x48, 0x44, 0x52,
-        0x00, 0x00, 0x00, 0x01,
-        0x00, 0x00, 0x00, 0x01,
-        0x08, 0x02,
-        0x00, 0x00, 0x00,
-        0x90, 0x77, 0x53, 0xDE,
-        0x00, 0x00, 0x00, 0x0C,
-        0x49, 0x44, 0x41, 0x54,
-        0x08, 0xD7, 0x63, 0xF8, 0xFF, 0xFF, 0x3F, 0x00,
-        0x05, 0xFE, 0x02, 0xFE,
-        0xA3, 0x1A, 0x8D, 0xEB,
-        0x00, 0x00, 0x00, 0x00,
-        0x49, 0x45, 0x4E, 0x44,
-        0xAE, 0x42, 0x60, 0x82,
-    ])
-    return png_data
+    ) as client1, AsyncClient(
+        transport=transport,
+        base_url="http://test",
+        headers={"Authorization": f"Bearer {token2}"},
+    ) as client2:
+        yield client1, client2
+
+
+@pytest_asyncio.fixture(scope="function")
+async def user1_wine_id(two_users_clients, sample_image_bytes) -> str:
+    """Check in a 3-bottle wine for user 1 and return its id."""
+    client1, _ = two_users_clients
+    response = await client1.post(
+        "/api/wines/checkin",
+        files=label_files(sample_image_bytes),
+        data={"name": "User1 Wine", "quantity": "3"},
+    )
+    assert response.status_code == 201
+    return response.json()["id"]
 
 
 # =============================================================================
@@ -91,19 +72,10 @@ def sample_image_bytes() -> bytes:
 # =============================================================================
 
 
-@pytest.mark.asyncio
-async def test_user_cannot_see_other_users_wines(
-    two_users_clients, sample_image_bytes
-) -> None:
+async def test_user_cannot_see_other_users_wines(two_users_clients) -> None:
     """Test that user1's wines are not visible to user2."""
     client1, client2 = two_users_clients
-
-    # User 1 checks in a wine
-    files = {"front_label": ("test.png", io.BytesIO(sample_image_bytes), "image/png")}
-    data = {"name": "User1 Wine", "quantity": "3"}
-    response = await client1.post("/api/wines/checkin", files=files, data=data)
-    assert response.status_code == 201
-    user1_wine_id = response.json()["id"]
+    await seed_wines([{"name": "User1 Wine", "quantity": 3}], "user1@example.com")
 
     # User 1 can see their wine
     response = await client1.get("/api/wines")
@@ -118,83 +90,57 @@ async def test_user_cannot_see_other_users_wines(
     wines = response.json()
     assert len(wines) == 0
 
-    # User 2 gets 404 when trying to access user1's wine directly
-    response = await client2.get(f"/api/wines/{user1_wine_id}")
-    assert response.status_code == 404
 
-
-@pytest.mark.asyncio
-async def test_user_cannot_modify_other_users_wines(
-    two_users_clients, sample_image_bytes
+# (method, path, request kwargs) for every endpoint scoped to a single wine
+WINE_ENDPOINTS = [
+    ("GET", "/api/wines/{id}", {}),
+    ("PUT", "/api/wines/{id}", {"json": {"name": "Hacked Wine"}}),
+    ("DELETE", "/api/wines/{id}", {}),
+    ("POST", "/api/wines/{id}/checkout", {"data": {"quantity": "1"}}),
+    ("GET", "/api/wines/{id}/grapes", {}),
+    ("GET", "/api/wines/{id}/scores", {}),
+    (
+        "POST",
+        "/api/wines/{id}/scores",
+        {"json": {"source": "Wine Spectator", "score": 95, "score_type": "100_point"}},
+    ),
+]
+
+
+async def test_user_cannot_access_other_users_wine_endpoints(
+    two_users_clients, user1_wine_id
 ) -> None:
-    """Test that user2 cannot update or delete user1's wines."""
-    client1, client2 = two_users_clients
-
-    # User 1 checks in a wine
-    files = {"front_label": ("test.png", io.BytesIO(sample_image_bytes), "image/png")}
-    data = {"name": "User1 Wine", "quantity": "3"}
-    response = await client1.post("/api/wines/checkin", files=files, data=data)
-    assert response.status_code == 201
-    user1_wine_id = response.json()["id"]
-
-    # User 2 cannot update user1's wine
-    response = await client2.put(
-        f"/api/wines/{user1_wine_id}",
-        json={"name": "Hacked Wine"}
-    )
-    assert response.status_code == 404
+    """Test that every per-wine endpoint returns 404 for another user's wine.
 
-    # User 2 cannot delete user1's wine
-    response = await client2.delete(f"/api/wines/{user1_wine_id}")
-    assert response.status_code == 404
-
-    # Verify wine is still unchanged
-    response = await client1.get(f"/api/wines/{user1_wine_id}")
-    assert response.status_code == 200
-    assert response.json()["name"] == "User1 Wine"
-
-
-@pytest.mark.asyncio
-async def test_user_cannot_checkout_other_users_wines(
-    two_users_clients, sample_image_bytes
-) -> None:
-    """Test that user2 cannot checkout wines from user1's cellar."""
+    All endpoints are checked against a single check-in, then the owner
+    verifies the wine was neither modified, checked out nor deleted.
+    """
     client1, client2 = two_users_clients
 
-    # User 1 checks in a wine
-    files = {"front_label": ("test.png", io.BytesIO(sample_image_bytes), "image/png")}
-    data = {"name": "User1 Wine", "quantity": "5"}
-    response = await client1.post("/api/wines/checkin", files=files, data=data)
-    assert response.status_code == 201
-    user1_wine_id = response.json()["id"]
+    for method, path_template, kwargs in WINE_ENDPOINTS:
+        path = path_template.format(id=user1_wine_id)
+        response = await client2.request(method, path, **kwargs)
+        assert response.status_code == 404, f"{method} {path}"
 
-    # User 2 cannot checkout user1's wine
-    checkout_data = {"quantity": "1"}
-    response = await client2.post(
-        f"/api/wines/{user1_wine_id}/checkout",
-        data=checkout_data
-    )
-    assert response.status_code == 404
+        # The owner can still read every GET endpoint
+        if method == "GET":
+            response = await client1.get(path)
+            assert response.status_code == 200, f"{method} {path}"
 
-    # Verify wine quantity is unchanged
+    # Verify wine is still unchanged
     response = await client1.get(f"/api/wines/{user1_wine_id}")
     assert response.status_code == 200
-    assert response.json()["inventory"]["quantity"] == 5
+    wine = response.json()
+    assert wine["name"] == "User1 Wine"
+    assert wine["inventory"]["quantity"] == 3
 
 
-@pytest.mark.asyncio
 async def test_user_cannot_see_other_users_transactions(
-    two_users_clients, sample_image_bytes
+    two_users_clients, user1_wine_id
 ) -> None:
     """Test that user2 cannot see user1's transactions."""
     client1, client2 = two_users_clients
 
-    # User 1 checks in a wine (creates a transaction)
-    files = {"front_label": ("test.png", io.BytesIO(sample_image_bytes), "image/png")}
-    data = {"name": "User1 Wine", "quantity": "3"}
-    response = await client1.post("/api/wines/checkin", files=files, data=data)
-    assert response.status_code == 201
-
     # User 1 can see their transactions
     response = await client1.get("/api/transactions")
     assert response.status_code == 200
@@ -209,326 +155,197 @@ async def test_user_cannot_see_other_users_transactions(
     assert len(transactions) == 0
 
 
-@pytest.mark.asyncio
-async def test_cellar_summary_shows_only_own_wines(
-    two_users_clients, sample_image_bytes
-) -> None:
+async def test_cellar_summary_shows_only_own_wines(two_users_clients) -> None:
     """Test that cellar summary only counts user's own wines."""
     client1, client2 = two_users_clients
 
-    # User 1 checks in 3 bottles
-    files = {"front_label": ("test.png", io.BytesIO(sample_image_bytes), "image/png")}
-    data = {"name": "User1 Wine", "quantity": "3"}
-    await client1.post("/api/wines/checkin", files=files, data=data)
-
-    # User 2 checks in 2 bottles
-    files = {"front_label": ("test.png", io.BytesIO(sample_image_bytes), "image/png")}
-    data = {"name": "User2 Wine", "quantity": "2"}
-    await client2.post("/api/wines/checkin", files=files, data=data)
-
-    # User 1's cellar summary should show 3 bottles
-    response = await client1.get("/api/cellar/summary")
-    assert response.status_code == 200
-    summary = response.json()
-    assert summary["total_bottles"] == 3
-    assert summary["unique_wines"] == 1
+    # User 1 owns 3 bottles while user 2 owns 2
+    await asyncio.gather(
+        seed_wines([{"name": "User1 Wine", "quantity": 3}], "user1@example.com"),
+        seed_wines([{"name": "User2 Wine", "quantity": 2}], "user2@example.com"),
+    )
 
-    # User 2's cellar summary should show 2 bottles
-    response = await client2.get("/api/cellar/summary")
-    assert response.status_code == 200
-    summary = response.json()
-    assert summary["total_bottles"] == 2
-    assert summary["unique_wines"] == 1
+    # Each user's cellar summary should only count their own bottles
+    response1, response2 = await asyncio.gather(
+        client1.get("/api/cellar/summary"), client2.get("/api/cellar/summary")
+    )
+    for response, bottles in ((response1, 3), (response2, 2)):
+        assert response.status_code == 200
+        summary = response.json()
+        assert summary["total_bottles"] == bottles
+        assert summary["unique_wines"] == 1
 
 
-@pytest.mark.asyncio
-async def test_cellar_inventory_shows_only_own_wines(
-    two_users_clients, sample_image_bytes
-) -> None:
+async def test_cellar_inventory_shows_only_own_wines(two_users_clients) -> None:
     """Test that cellar inventory only shows user's own wines."""
     client1, client2 = two_users_clients
 
-    # User 1 checks in a wine
-    files = {"front_label": ("test.png", io.BytesIO(sample_image_bytes), "image/png")}
-    data = {"name": "User1 Wine", "quantity": "1"}
-    await client1.post("/api/wines/checkin", files=files, data=data)
-
-    # User 2 checks in a different wine
-    files = {"front_label": ("test.png", io.BytesIO(sample_image_bytes), "image/png")}
-    data = {"name": "User2 Wine", "quantity": "1"}
-    await client2.post("/api/wines/checkin", files=files, data=data)
-
-    # User 1's cellar should only show their wine
-    response = await client1.get("/api/cellar")
-    assert response.status_code == 200
-    wines = response.json()
-    assert len(wines) == 1
-    assert wines[0]["name"] == "User1 Wine"
+    # Seed one wine per user directly; these tests only cover reads
+    await asyncio.gather(
+        seed_wines([{"name": "User1 Wine", "quantity": 1}], "user1@example.com"),
+        seed_wines([{"name": "User2 Wine", "quantity": 1}], "user2@example.com"),
+    )
 
-    # User 2's cellar should only show their wine
-    response = await client2.get("/api/cellar")
-    assert response.status_code == 200
-    wines = response.json()
-    assert len(wines) == 1
-    assert wines[0]["name"] == "User2 Wine"
+    # Each user's cellar should only show their wine
+    response1, response2 = await asyncio.gather(
+        client1.get("/api/cellar"), client2.get("/api/cellar")
+    )
+    for response, name in ((response1, "User1 Wine"), (response2, "User2 Wine")):
+        assert response.status_code == 200
+        wines = response.json()
+        assert len(wines) == 1
+        assert wines[0]["name"] == name
 
 
-@pytest.mark.asyncio
-async def test_search_only_searches_own_wines(
-    two_users_clients, sample_image_bytes
-) -> None:
+async def test_search_only_searches_own_wines(two_users_clients) -> None:
     """Test that search only returns user's own wines."""
     client1, client2 = two_users_clients
 
-    # User 1 checks in a Bordeaux wine
-    files = {"front_label": ("test.png", io.BytesIO(sample_image_bytes), "image/png")}
-    data = {"name": "Bordeaux Classic", "region": "Bordeaux", "quantity": "1"}
-    await client1.post("/api/wines/checkin", files=files, data=data)
-
-    # User 2 checks in a different Bordeaux wine
-    files = {"front_label": ("test.png", io.BytesIO(sample_image_bytes), "image/png")}
-    data = {"name": "Bordeaux Reserve", "region": "Bordeaux", "quantity": "1"}
-    await client2.post("/api/wines/checkin", files=files, data=data)
-
-    # User 1 searches for Bordeaux - should only find their wine
-    response = await client1.get("/api/search?region=Bordeaux")
-    assert response.status_code == 200
-    wines = response.json()
-    assert len(wines) == 1
-    assert wines[0]["name"] == "Bordeaux Classic"
-
-    # User 2 searches for Bordeaux - should only find their wine
-    response = await client2.get("/api/search?region=Bordeaux")
-    assert response.status_code == 200
-    wines = response.json()
-    assert len(wines) == 1
-    assert wines[0]["name"] == "Bordeaux Reserve"
-
-
-@pytest.mark.asyncio
-async def test_export_only_exports_own_wines(
-    two_users_clients, sample_image_bytes
-) -> None:
-    """Test that export only includes user's own wines."""
-    client1, client2 = two_users_clients
-
-    # User 1 checks in a wine
-    files = {"front_label": ("test.png", io.BytesIO(sample_image_bytes), "image/png")}
-    data = {"name": "User1 Export Wine", "quantity": "1"}
-    await client1.post("/api/wines/checkin", files=files, data=data)
-
-    # User 2 checks in a wine
-    files = {"front_label": ("test.png", io.BytesIO(sample_image_bytes), "image/png")}
-    data = {"name": "User2 Export Wine", "quantity": "1"}
-    await client2.post("/api/wines/checkin", files=files, data=data)
-
-    # User 1 exports wines - should only include their wine
-    response = await client1.get("/api/export/wines?format=json")
-    assert response.status_code == 200
-    data = response.json()
-    assert len(data["wines"]) == 1
-    assert data["wines"][0]["name"] == "User1 Export Wine"
-
-    # User 2 exports wines - should only include their wine
-    response = await client2.get("/api/export/wines?format=json")
-    assert response.status_code == 200
-    data = response.json()
-    assert len(data["wines"]) == 1
-    assert data["wines"][0]["name"] == "User2 Export Wine"
-
-
-@pytest.mark.asyncio
-async def test_export_transactions_only_exports_own(
-    two_users_clients, sample_image_bytes
-) -> None:
-    """Test that transaction export only includes user's own transactions."""
-    client1, client2 = two_users_clients
-
-    # User 1 checks in a wine
-    files = {"front_label": ("test.png", io.BytesIO(sample_image_bytes), "image/png")}
-    data = {"name": "User1 Wine", "quantity": "1"}
-    await client1.post("/api/wines/checkin", files=files, data=data)
-
-    # User 2 checks in a wine
-    files = {"front_label": ("test.png", io.BytesIO(sample_image_bytes), "image/png")}
-    data = {"name": "User2 Wine", "quantity": "1"}
-    await client2.post("/api/wines/checkin", files=files, data=data)
-
-    # User 1 exports transactions - should only include their transaction
-    response = await client1.get("/api/export/transactions?format=json")
-    assert response.status_code == 200
-    data = response.json()
-    assert len(data["transactions"]) == 1
-
-    # User 2 exports transactions - should only include their transaction
-    response = await client2.get("/api/export/transactions?format=json")
-    assert response.status_code == 200
-    data = response.json()
-    assert len(data["transactions"]) == 1
-
-
-@pytest.mark.asyncio
-async def test_user_cannot_access_other_users_wine_grapes(
-    two_users_clients, sample_image_bytes
-) -> None:
-    """Test that user2 cannot access user1's wine grape blend."""
-    client1, client2 = two_users_clients
-
-    # User 1 checks in a wine
-    files = {"front_label": ("test.png", io.BytesIO(sample_image_bytes), "image/png")}
-    data = {"name": "User1 Wine", "quantity": "1"}
-    response = await client1.post("/api/wines/checkin", files=files, data=data)
-    user1_wine_id = response.json()["id"]
-
-    # User 1 can access their wine's grape info
-    response = await client1.get(f"/api/wines/{user1_wine_id}/grapes")
-    assert response.status_code == 200
-
-    # User 2 cannot access user1's wine grapes
-    response = await client2.get(f"/api/wines/{user1_wine_id}/grapes")
-    assert response.status_code == 404
-
-
-@pytest.mark.asyncio
-async def test_user_cannot_access_other_users_wine_scores(
-    two_users_clients, sample_image_bytes
-) -> None:
-    """Test that user2 cannot access user1's wine scores."""
-    client1, client2 = two_users_clients
-
-    # User 1 checks in a wine
-    files = {"front_label": ("test.png", io.BytesIO(sample_image_bytes), "image/png")}
-    data = {"name": "User1 Wine", "quantity": "1"}
-    response = await client1.post("/api/wines/checkin", files=files, data=data)
-    user1_wine_id = response.json()["id"]
-
-    # User 1 can access their wine's scores
-    response = await client1.get(f"/api/wines/{user1_wine_id}/scores")
-    assert response.status_code == 200
+    # Seed one Bordeaux wine per user directly
+    await asyncio.gather(
+        seed_wines(
+            [{"name": "Bordeaux Classic", "region": "Bordeaux"}], "user1@example.com"
+        ),
+        seed_wines(
+            [{"name": "Bordeaux Reserve", "region": "Bordeaux"}], "user2@example.com"
+        ),
+    )
 
-    # User 2 cannot access user1's wine scores
-    response = await client2.get(f"/api/wines/{user1_wine_id}/scores")
-    assert response.status_code == 404
+    # Both users search for Bordeaux - each should only find their wine
+    response1, response2 = await asyncio.gather(
+        client1.get("/api/search?region=Bordeaux"),
+        client2.get("/api/search?region=Bordeaux"),
+    )
+    for response, name in (
+        (response1, "Bordeaux Classic"),
+        (response2, "Bordeaux Reserve"),
+    ):
+        assert response.status_code == 200
+        wines = response.json()
+        assert len(wines) == 1
+        assert wines[0]["name"] == name
 
 
-@pytest.mark.asyncio
-async def test_user_cannot_add_scores_to_other_users_wines(
+async def test_exports_only_include_own_data(
     two_users_clients, sample_image_bytes
 ) -> None:
-    """Test that user2 cannot add scores to user1's wines."""
+    """Test that wine and transaction exports only include the user's own data."""
     client1, client2 = two_users_clients
 
-    # User 1 checks in a wine
-    files = {"front_label": ("test.png", io.BytesIO(sample_image_bytes), "image/png")}
-    data = {"name": "User1 Wine", "quantity": "1"}
-    response = await client1.post("/api/wines/checkin", files=files, data=data)
-    user1_wine_id = response.json()["id"]
-
-    # User 2 cannot add a score to user1's wine
-    score_data = {
-        "source": "Wine Spectator",
-        "score": 95,
-        "score_type": "100_point",
-    }
-    response = await client2.post(
-        f"/api/wines/{user1_wine_id}/scores",
-        json=score_data
+    # Check in through the API so each user also gets a CHECK_IN transaction
+    response1, response2 = await asyncio.gather(
+        client1.post(
+            "/api/wines/checkin",
+            files=label_files(sample_image_bytes),
+            data={"name": "User1 Export Wine", "quantity": "1"},
+        ),
+        client2.post(
+            "/api/wines/checkin",
+            files=label_files(sample_image_bytes),
+            data={"name": "User2 Export Wine", "quantity": "1"},
+        ),
     )
-    assert response.status_code == 404
+    assert response1.status_code == 201
+    assert response2.status_code == 201
+
+    for client, wine_name in (
+        (client1, "User1 Export Wine"),
+        (client2, "User2 Export Wine"),
+    ):
+        wines_response, transactions_response = await asyncio.gather(
+            client.get("/api/export/wines?format=json"),
+            client.get("/api/export/transactions?format=json"),
+        )
+        assert wines_response.status_code == 200
+        wines = wines_response.json()["wines"]
+        assert len(wines) == 1
+        assert wines[0]["name"] == wine_name
+
+        assert transactions_response.status_code == 200
+        assert len(transactions_response.json()["transactions"]) == 1
 
 
-@pytest.mark.asyncio
 async def test_both_users_can_manage_their_own_wines_independently(
     two_users_clients, sample_image_bytes
 ) -> None:
     """Test that both users can fully manage their own wines independently."""
     client1, client2 = two_users_clients
 
-    # User 1 checks in and manages a wine
-    files = {"front_label": ("test.png", io.BytesIO(sample_image_bytes), "image/png")}
-    data = {"name": "User1 Wine", "quantity": "5"}
-    response = await client1.post("/api/wines/checkin", files=files, data=data)
-    assert response.status_code == 201
-    user1_wine_id = response.json()["id"]
-
-    # User 2 checks in and manages their own wine
-    files = {"front_label": ("test.png", io.BytesIO(sample_image_bytes), "image/png")}
-    data = {"name": "User2 Wine", "quantity": "3"}
-    response = await client2.post("/api/wines/checkin", files=files, data=data)
-    assert response.status_code == 201
-    user2_wine_id = response.json()["id"]
-
-    # User 1 updates their wine
-    response = await client1.put(
-        f"/api/wines/{user1_wine_id}",
-        json={"name": "User1 Wine Updated"}
+    # Each user checks in their own wine
+    response1, response2 = await asyncio.gather(
+        client1.post(
+            "/api/wines/checkin",
+            files=label_files(sample_image_bytes),
+            data={"name": "User1 Wine", "quantity": "5"},
+        ),
+        client2.post(
+            "/api/wines/checkin",
+            files=label_files(sample_image_bytes),
+            data={"name": "User2 Wine", "quantity": "3"},
+        ),
     )
-    assert response.status_code == 200
-
-    # User 2 updates their wine
-    response = await client2.put(
-        f"/api/wines/{user2_wine_id}",
-        json={"name": "User2 Wine Updated"}
+    assert response1.status_code == 201
+    assert response2.status_code == 201
+    user1_wine_id = response1.json()["id"]
+    user2_wine_id = response2.json()["id"]
+
+    # Each user renames their wine
+    response1, response2 = await asyncio.gather(
+        client1.put(f"/api/wines/{user1_wine_id}", json={"name": "User1 Wine Updated"}),
+        client2.put(f"/api/wines/{user2_wine_id}", json={"name": "User2 Wine Updated"}),
     )
-    assert response.status_code == 200
+    assert response1.status_code == 200
+    assert response2.status_code == 200
 
-    # User 1 checks out from their wine
-    response = await client1.post(
-        f"/api/wines/{user1_wine_id}/checkout",
-        data={"quantity": "2"}
-    )
-    assert response.status_code == 200
-    assert response.json()["inventory"]["quantity"] == 3
-
-    # User 2 checks out from their wine
-    response = await client2.post(
-        f"/api/wines/{user2_wine_id}/checkout",
-        data={"quantity": "1"}
+    # Each user checks out from their wine
+    response1, response2 = await asyncio.gather(
+        client1.post(f"/api/wines/{user1_wine_id}/checkout", data={"quantity": "2"}),
+        client2.post(f"/api/wines/{user2_wine_id}/checkout", data={"quantity": "1"}),
     )
-    assert response.status_code == 200
-    assert response.json()["inventory"]["quantity"] == 2
-
-    # Verify final states are independent
-    response = await client1.get(f"/api/wines/{user1_wine_id}")
-    assert response.json()["name"] == "User1 Wine Updated"
-    assert response.json()["inventory"]["quantity"] == 3
 
-    response = await client2.get(f"/api/wines/{user2_wine_id}")
-    assert response.json()["name"] == "User2 Wine Updated"
-    assert response.json()["inventory"]["quantity"] == 2
+    # Checkout returns the full wine, so it shows the final state directly
+    for response, name, quantity in (
+        (response1, "User1 Wine Updated", 3),
+        (response2, "User2 Wine Updated", 2),
+    ):
+        assert response.status_code == 200
+        wine = response.json()
+        assert wine["name"] == name
+        assert wine["inventory"]["quantity"] == quantity
 
 
-@pytest.mark.asyncio
 async def test_delete_all_wines_only_deletes_own_wines(
     two_users_clients, sample_image_bytes
 ) -> None:
     """Test that deleting all wines only affects the current user's collection."""
     client1, client2 = two_users_clients
 
-    # User 1 checks in a wine
-    files = {"front_label": ("test.png", io.BytesIO(sample_image_bytes), "image/png")}
-    data = {"name": "User1 Wine", "quantity": "2"}
-    response = await client1.post("/api/wines/checkin", files=files, data=data)
-    assert response.status_code == 201
-
-    # User 2 checks in a wine
-    files = {"front_label": ("test.png", io.BytesIO(sample_image_bytes), "image/png")}
-    data = {"name": "User2 Wine", "quantity": "3"}
-    response = await client2.post("/api/wines/checkin", files=files, data=data)
-    assert response.status_code == 201
+    # Each user checks in a wine
+    responses = await asyncio.gather(
+        client1.post(
+            "/api/wines/checkin",
+            files=label_files(sample_image_bytes),
+            data={"name": "User1 Wine", "quantity": "2"},
+        ),
+        client2.post(
+            "/api/wines/checkin",
+            files=label_files(sample_image_bytes),
+            data={"name": "User2 Wine", "quantity": "3"},
+        ),
+    )
+    assert all(response.status_code == 201 for response in responses)
 
     # User 1 deletes all their wines
     response = await client1.delete("/api/wines/all")
     assert response.status_code == 200
     assert response.json()["deleted_wines"] == 1
 
-    # User 1 has no wines
-    response = await client1.get("/api/wines")
-    assert response.json() == []
-
-    # User 2's wine survives
-    response = await client2.get("/api/wines")
-    wines = response.json()
+    # User 1 has no wines while user 2's wine survives
+    response1, response2 = await asyncio.gather(
+        client1.get("/api/wines"), client2.get("/api/wines")
+    )
+    assert response1.json() == []
+    wines = response2.json()
     assert len(wines) == 1
     assert wines[0]["name"] == "User2 Wine"
     assert wines[0]["inventory"]["quantity"] == 3
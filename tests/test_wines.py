@@ -5,6 +5,8 @@ import io
 import pytest
 from httpx import AsyncClient
 
+from tests.conftest import label_files
+
 
 @pytest.mark.asyncio
 async def test_health_check(client: AsyncClient) -> None:
@@ -29,9 +31,7 @@ async def test_root_serves_web_interface(client: AsyncClient) -> None:
 async def test_checkin_wine(client: AsyncClient, sample_image_bytes: bytes) -> None:
     """Test checking in a wine."""
     # Create form data with image
-    files = {
-        "front_label": ("test.png", io.BytesIO(sample_image_bytes), "image/png"),
-    }
+    files = label_files(sample_image_bytes)
     data = {
         "name": "Test Wine",
         "winery": "Test Winery",
@@ -55,9 +55,7 @@ async def test_checkin_wine(client: AsyncClient, sample_image_bytes: bytes) -> N
 @pytest.mark.asyncio
 async def test_checkin_wine_minimal(client: AsyncClient, sample_image_bytes: bytes) -> None:
     """Test checking in a wine with minimal data."""
-    files = {
-        "front_label": ("test.png", io.BytesIO(sample_image_bytes), "image/png"),
-    }
+    files = label_files(sample_image_bytes)
     data = {
         "quantity": "1",
     }
@@ -83,9 +81,7 @@ async def test_list_wines_empty(client: AsyncClient) -> None:
 async def test_list_wines(client: AsyncClient, sample_image_bytes: bytes) -> None:
     """Test listing wines after check-in."""
     # Check in a wine first
-    files = {
-        "front_label": ("test.png", io.BytesIO(sample_image_bytes), "image/png"),
-    }
+    files = label_files(sample_image_bytes)
     data = {
         "name": "Test Wine",
         "quantity": "1",
@@ -104,9 +100,7 @@ async def test_list_wines(client: AsyncClient, sample_image_bytes: bytes) -> Non
 async def test_get_wine_detail(client: AsyncClient, sample_image_bytes: bytes) -> None:
     """Test getting wine details."""
     # Check in a wine
-    files = {
-        "front_label": ("test.png", io.BytesIO(sample_image_bytes), "image/png"),
-    }
+    files = label_files(sample_image_bytes)
     data = {
         "name": "Test Wine",
         "quantity": "3",
@@ -136,9 +130,7 @@ async def test_get_wine_not_found(client: AsyncClient) -> None:
 async def test_update_wine(client: AsyncClient, sample_image_bytes: bytes) -> None:
     """Test updating wine metadata."""
     # Check in a wine
-    files = {
-        "front_label": ("test.png", io.BytesIO(sample_image_bytes), "image/png"),
-    }
+    files = label_files(sample_image_bytes)
     data = {"name": "Original Name", "quantity": "1"}
     checkin_response = await client.post("/api/wines/checkin", files=files, data=data)
     wine_id = checkin_response.json()["id"]
@@ -159,9 +151,7 @@ async def test_update_wine(client: AsyncClient, sample_image_bytes: bytes) -> No
 async def test_checkout_wine(client: AsyncClient, sample_image_bytes: bytes) -> None:
     """Test checking out wine."""
     # Check in wine
-    files = {
-        "front_label": ("test.png", io.BytesIO(sample_image_bytes), "image/png"),
-    }
+    files = label_files(sample_image_bytes)
     data = {"name": "Test Wine", "quantity": "5"}
     checkin_response = await client.post("/api/wines/checkin", files=files, data=data)
     wine_id = checkin_response.json()["id"]
@@ -179,9 +169,7 @@ async def test_checkout_wine(client: AsyncClient, sample_image_bytes: bytes) ->
 async def test_checkout_exceeds_stock(client: AsyncClient, sample_image_bytes: bytes) -> None:
     """Test checking out more than available stock."""
     # Check in wine
-    files = {
-        "front_label": ("test.png", io.BytesIO(sample_image_bytes), "image/png"),
-    }
+    files = label_files(sample_image_bytes)
     data = {"name": "Test Wine", "quantity": "2"}
     checkin_response = await client.post("/api/wines/checkin", files=files, data=data)
     wine_id = checkin_response.json()["id"]
@@ -197,9 +185,7 @@ async def test_checkout_exceeds_stock(client: AsyncClient, sample_image_bytes: b
 async def test_delete_wine(client: AsyncClient, sample_image_bytes: bytes) -> None:
     """Test deleting a wine."""
     # Check in wine
-    files = {
-        "front_label": ("test.png", io.BytesIO(sample_image_bytes), "image/png"),
-    }
+    files = label_files(sample_image_bytes)
     data = {"name": "Test Wine", "quantity": "1"}
     checkin_response = await client.post("/api/wines/checkin", files=files, data=data)
     wine_id = checkin_response.json()["id"]
@@ -224,9 +210,7 @@ async def test_checkin_rejects_oversized_file(client: AsyncClient) -> None:
     # Create a file that exceeds the max upload size
     oversized_data = b"x" * (settings.max_upload_size_bytes + 1)
 
-    files = {
-        "front_label": ("test.png", io.BytesIO(oversized_data), "image/png"),
-    }
+    files = label_files(oversized_data)
     data = {"name": "Test Wine", "quantity": "1"}
 
     response = await client.post("/api/wines/checkin", files=files, data=data)
@@ -258,9 +242,7 @@ async def test_scan_rejects_oversized_file(client: AsyncClient) -> None:
     # Create a file that exceeds the max upload size
     oversized_data = b"x" * (settings.max_upload_size_bytes + 1)
 
-    files = {
-        "front_label": ("test.png", io.BytesIO(oversized_data), "image/png"),
-    }
+    files = label_files(oversized_data)
 
     response = await client.post("/api/wines/scan", files=files)
     assert response.status_code == 413
@@ -274,9 +256,7 @@ async def test_checkin_with_prescanned_text(client: AsyncClient, sample_image_by
     This tests the optimization where the frontend scans labels once on upload
     and passes the extracted text to checkin to avoid duplicate API calls.
     """
-    files = {
-        "front_label": ("test.png", io.BytesIO(sample_image_bytes), "image/png"),
-    }
+    files = label_files(sample_image_bytes)
     data = {
         "name": "Pre-scanned Wine",
         "winery": "Test Winery",
@@ -302,9 +282,7 @@ async def test_scan_endpoint_returns_parsed_data(client: AsyncClient, sample_ima
     This endpoint is used by the frontend to scan labels on upload
     before the user clicks 'Check In Wine'.
     """
-    files = {
-        "front_label": ("test.png", io.BytesIO(sample_image_bytes), "image/png"),
-    }
+    files = label_files(sample_image_bytes)
 
     response = await client.post("/api/wines/scan", files=files)
     assert response.status_code == 200
@@ -391,9 +369,7 @@ async def test_checkin_with_custom_fields(client: AsyncClient, sample_image_byte
     """Test checking in a wine with custom fields."""
     import json
 
-    files = {
-        "front_label": ("test.png", io.BytesIO(sample_image_bytes), "image/png"),
-    }
+    files = label_files(sample_image_bytes)
     custom = {"Cellar Location": "Rack 3A", "Purchase Price": "$50"}
     data = {
         "name": "Custom Fields Wine",
@@ -415,9 +391,7 @@ async def test_checkin_with_custom_fields(client: AsyncClient, sample_image_byte
 async def test_wine_without_image_path(client: AsyncClient, sample_image_bytes: bytes) -> None:
     """Test that front_label_image_path can be None (imported wines)."""
     # Check in a wine first (this will have an image path)
-    files = {
-        "front_label": ("test.png", io.BytesIO(sample_image_bytes), "image/png"),
-    }
+    files = label_files(sample_image_bytes)
     data = {"name": "Test Wine", "quantity": "1"}
     response = await client.post("/api/wines/checkin", files=files, data=data)
     assert response.status_code == 201
@@ -437,9 +411,7 @@ async def test_delete_all_wines(client: AsyncClient, sample_image_bytes: bytes)
     """Test deleting all wines in the collection."""
     # Check in 3 wines
     for i in range(3):
-        files = {
-            "front_label": ("test.png", io.BytesIO(sample_image_bytes), "image/png"),
-        }
+        files = label_files(sample_image_bytes)
         data = {"name": f"Wine {i}", "quantity": "1"}
         response = await client.post("/api/wines/checkin", files=files, data=data)
         assert response.status_code == 201
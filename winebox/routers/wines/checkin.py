@@ -110,9 +110,17 @@ async def checkin_wine(
         # Fall back to Tesseract if needed
         if not parsed_data.get("name"):
             logger.info("Using Tesseract OCR for checkin analysis")
-            front_text = await ocr_service.extract_text(front_image_path)
-            if back_image_path:
-                back_text = await ocr_service.extract_text(back_image_path)
+
+            # The back label is optional; keep any pre-scanned text without one
+            async def ocr_back() -> str | None:
+                if back_image_path:
+                    return await ocr_service.extract_text(back_image_path)
+                return back_text
+
+            # OCR both labels concurrently (Tesseract runs in worker threads)
+            front_text, back_text = await asyncio.gather(
+                ocr_service.extract_text(front_image_path), ocr_back()
+            )
 
             combined_text = front_text
             if back_text:
@@ -96,11 +96,17 @@ async def scan_label(
 
     # Fall back to Tesseract OCR
     logger.info("Using Tesseract OCR for label analysis")
-    front_text = await ocr_service.extract_text_from_bytes(front_data)
 
-    back_text = None
-    if back_data:
-        back_text = await ocr_service.extract_text_from_bytes(back_data)
+    # The back label is optional; skip OCR when none was uploaded
+    async def ocr_back() -> str | None:
+        if back_data:
+            return await ocr_service.extract_text_from_bytes(back_data)
+        return None
+
+    # OCR both labels concurrently (Tesseract runs in worker threads)
+    front_text, back_text = await asyncio.gather(
+        ocr_service.extract_text_from_bytes(front_data), ocr_back()
+    )
 
     # Parse wine details from OCR text
     combined_text = front_text
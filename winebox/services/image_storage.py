@@ -25,6 +25,12 @@ EXTENSION_MIME_MAP = {
     ".webp": "image/webp",
 }
 
+# Uploads are copied to disk in chunks of this size
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+# Number of leading bytes needed to detect the image type
+MAGIC_BYTES_LENGTH = 12
+
 # Magic byte signatures for image formats
 # Each entry is (magic_bytes, offset, detected_extension)
 IMAGE_MAGIC_SIGNATURES = [
@@ -49,7 +55,7 @@ def detect_image_type(content: bytes) -> str | None:
     Returns:
         The detected extension (e.g., ".jpg") or None if not a valid image.
     """
-    if len(content) < 12:
+    if len(content) < MAGIC_BYTES_LENGTH:
         return None
 
     for magic, offset, ext in IMAGE_MAGIC_SIGNATURES:
@@ -143,34 +149,41 @@ class ImageStorageService:
                 detail=str(e),
             )
 
-        # Read content with size limit check
-        content = await upload_file.read()
-        if len(content) > self.max_size_bytes:
-            max_mb = self.max_size_bytes / (1024 * 1024)
-            raise HTTPException(
-                status_code=status.HTTP_413_CONTENT_TOO_LARGE,
-                detail=f"File size exceeds maximum allowed size of {max_mb:.1f} MB",
-            )
-
-        # Validate magic bytes - ensure file content matches a valid image format
-        detected_ext = detect_image_type(content)
-        if detected_ext is None:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Invalid file content. File does not appear to be a valid image.",
-            )
-
-        # Use the detected extension (more reliable than declared extension)
-        # This prevents attacks where malicious files are renamed to .jpg/.png
-        ext = detected_ext
-
-        # Generate unique filename with detected extension
-        filename = f"{uuid.uuid4()}{ext}"
-        file_path = self.storage_path / filename
-
-        # Save file
-        async with aiofiles.open(file_path, "wb") as f:
-            await f.write(content)
+        # Stream the upload to a partial file in chunks so the whole image is
+        # never held in memory; it is renamed once validation passes
+        file_id = uuid.uuid4()
+        part_path = self.storage_path / f"{file_id}.part"
+        size = 0
+        head = b""
+        try:
+            async with aiofiles.open(part_path, "wb") as f:
+                while chunk := await upload_file.read(UPLOAD_CHUNK_SIZE):
+                    size += len(chunk)
+                    if size > self.max_size_bytes:
+                        max_mb = self.max_size_bytes / (1024 * 1024)
+                        raise HTTPException(
+                            status_code=status.HTTP_413_CONTENT_TOO_LARGE,
+                            detail=f"File size exceeds maximum allowed size of {max_mb:.1f} MB",
+                        )
+                    if len(head) < MAGIC_BYTES_LENGTH:
+                        head += chunk[:MAGIC_BYTES_LENGTH - len(head)]
+                    await f.write(chunk)
+
+            # Validate magic bytes - ensure file content matches a valid image format
+            detected_ext = detect_image_type(head)
+            if detected_ext is None:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Invalid file content. File does not appear to be a valid image.",
+                )
+
+            # Use the detected extension (more reliable than declared extension)
+            # This prevents attacks where malicious files are renamed to .jpg/.png
+            filename = f"{file_id}{detected_ext}"
+            part_path.rename(self.storage_path / filename)
+        except BaseException:
+            part_path.unlink(missing_ok=True)
+            raise
 
         return filename
 
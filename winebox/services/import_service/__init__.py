@@ -3,15 +3,18 @@
 from .constants import (
     CANONICAL_WINE_FIELDS,
     HEADER_ALIASES,
+    INSERT_BATCH_SIZE,
     MAX_ROWS,
     NON_WINE_KEYWORDS,
     VALID_WINE_FIELDS,
     WINE_FIELD_DESCRIPTIONS,
 )
 from .converters import (
+    CompiledMapping,
     _coerce_float,
     _coerce_int,
     _coerce_vintage,
+    _compile_mapping,
     _compute_custom_fields_text,
     is_non_wine_row,
     row_to_wine_data,
@@ -29,6 +32,7 @@ __all__ = [
     # Constants
     "CANONICAL_WINE_FIELDS",
     "HEADER_ALIASES",
+    "INSERT_BATCH_SIZE",
     "MAX_ROWS",
     "NON_WINE_KEYWORDS",
     "VALID_WINE_FIELDS",
@@ -42,11 +46,13 @@ __all__ = [
     "_is_valid_mapping_value",
     "_static_fallback",
     # Converters
+    "CompiledMapping",
     "is_non_wine_row",
     "row_to_wine_data",
     "_coerce_float",
     "_coerce_int",
     "_coerce_vintage",
+    "_compile_mapping",
     "_compute_custom_fields_text",
     # Processor
     "process_import_batch",
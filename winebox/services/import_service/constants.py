@@ -3,6 +3,9 @@
 # Maximum rows per import batch (safety limit for MongoDB 16MB doc size)
 MAX_ROWS = 5000
 
+# Wines per bulk insert when processing an import batch
+INSERT_BATCH_SIZE = 1000
+
 # Header alias table: lowercase alias -> wine field name
 HEADER_ALIASES: dict[str, str] = {
     # name
@@ -86,15 +89,15 @@ HEADER_ALIASES: dict[str, str] = {
     "tasting notes": "notes",
 }
 
-# Valid wine field names that can be mapped to
-VALID_WINE_FIELDS = {
+# Valid wine field names that can be mapped to (immutable, O(1) membership)
+VALID_WINE_FIELDS: frozenset[str] = frozenset({
     "name", "winery", "vintage", "grape_variety", "region", "sub_region",
     "appellation", "country", "alcohol_percentage", "wine_type_id",
     "classification", "price_tier", "quantity", "notes",
-}
+})
 
 # Core identifying fields for a wine record (name is required; others strongly recommended)
-CANONICAL_WINE_FIELDS = ["name", "winery", "vintage", "grape_variety", "country", "region"]
+CANONICAL_WINE_FIELDS: tuple[str, ...] = ("name", "winery", "vintage", "grape_variety", "country", "region")
 
 # Human-readable descriptions for each wine field (used in AI mapping prompt)
 WINE_FIELD_DESCRIPTIONS: dict[str, str] = {
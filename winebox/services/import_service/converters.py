@@ -1,6 +1,9 @@
 """Row filtering and data conversion functions for wine imports."""
 
+import re
+from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Any
 
 from beanie import PydanticObjectId
@@ -9,59 +12,130 @@ from winebox.models.wine import InventoryInfo
 
 from .constants import NON_WINE_KEYWORDS, VALID_WINE_FIELDS
 
+# Single alternation over all non-wine keywords, matched as substrings
+_NON_WINE_RE = re.compile(
+    "|".join(re.escape(k) for k in sorted(NON_WINE_KEYWORDS)),
+    re.IGNORECASE,
+)
 
-def is_non_wine_row(row: dict[str, Any], mapping: dict[str, str]) -> bool:
-    """Check if a row appears to be a non-wine item (spirits, beer, etc.).
+# Four-digit year with an optional "+" sign and leading zeros, optionally with
+# a fractional part (spreadsheets often export years as floats like "2015.0");
+# the fraction is truncated. Exponent forms such as "2015e0" are not accepted.
+_VINTAGE_RE = re.compile(r"\s*\+?0*(\d{4})(?:\.\d*)?\s*$")
 
-    Checks columns mapped to wine_type_id or name for non-wine keywords.
+# Plain decimal number with an optional sign and trailing percent sign
+# ("13.5%", "+13.5 %"). A comma is read as the decimal separator ("13,5"),
+# as European spreadsheets write ABV. Exponents, underscores, inf/nan and a
+# leading "%" are not accepted.
+_FLOAT_RE = re.compile(r"\s*([-+]?(?:\d+[.,]?\d*|[.,]\d+))\s*%?\s*$")
+
+
+@dataclass(frozen=True)
+class CompiledMapping:
+    """A column mapping pre-split by target field.
+
+    Built once per import so the per-row code only visits the headers each
+    step needs instead of re-dispatching on every mapping entry.
+    """
+
+    filter_headers: tuple[str, ...]
+    name_headers: tuple[str, ...]
+    text_fields: tuple[tuple[str, str], ...]
+    vintage_headers: tuple[str, ...]
+    alcohol_headers: tuple[str, ...]
+    quantity_headers: tuple[str, ...]
+    custom_fields: tuple[tuple[str, str], ...]
+
+
+def _compile_mapping(mapping: dict[str, str] | CompiledMapping) -> CompiledMapping:
+    """Split a header -> field mapping into per-field header lists.
 
     Args:
-        row: Raw row dict from spreadsheet.
-        mapping: Column mapping dict.
+        mapping: Column mapping dict (or an already compiled mapping).
 
     Returns:
-        True if the row appears to be a non-wine item.
+        CompiledMapping preserving the original header order in each list.
     """
-    # Find columns mapped to type or name
-    cols_to_check = []
+    if isinstance(mapping, CompiledMapping):
+        return mapping
+
+    text_fields: list[tuple[str, str]] = []
+    custom_fields: list[tuple[str, str]] = []
+    vintage_headers: list[str] = []
+    alcohol_headers: list[str] = []
+    quantity_headers: list[str] = []
     for header, field in mapping.items():
-        if field in ("wine_type_id", "name"):
-            cols_to_check.append(header)
+        if field.startswith("custom:"):
+            custom_fields.append((header, field[7:]))  # Remove "custom:" prefix
+        elif field == "vintage":
+            vintage_headers.append(header)
+        elif field == "alcohol_percentage":
+            alcohol_headers.append(header)
+        elif field == "quantity":
+            quantity_headers.append(header)
+        elif field in VALID_WINE_FIELDS:
+            text_fields.append((header, field))
+
+    return CompiledMapping(
+        filter_headers=tuple(h for h, f in mapping.items() if f in ("wine_type_id", "name")),
+        name_headers=tuple(h for h, f in mapping.items() if f == "name"),
+        text_fields=tuple(text_fields),
+        vintage_headers=tuple(vintage_headers),
+        alcohol_headers=tuple(alcohol_headers),
+        quantity_headers=tuple(quantity_headers),
+        custom_fields=tuple(custom_fields),
+    )
+
 
-    for col in cols_to_check:
-        value = row.get(col, "").lower().strip()
-        for keyword in NON_WINE_KEYWORDS:
-            if keyword in value:
-                return True
+def is_non_wine_row(row: dict[str, Any], mapping: dict[str, str] | CompiledMapping) -> bool:
+    """Check if a row appears to be a non-wine item (spirits, beer, etc.).
 
-    return False
+    Checks columns mapped to wine_type_id or name for non-wine keywords.
 
+    Args:
+        row: Raw row dict from spreadsheet.
+        mapping: Column mapping dict, or a CompiledMapping for batch callers.
 
+    Returns:
+        True if the row appears to be a non-wine item.
+    """
+    # Scan the values of columns mapped to type or name in one regex search
+    values = [
+        value
+        for header in _compile_mapping(mapping).filter_headers
+        if (value := row.get(header))
+    ]
+    # Fast path: no type/name column mapped, or all of them empty in this row
+    if not values:
+        return False
+    return _NON_WINE_RE.search(" ".join(values)) is not None
+
+
+# The coercion helpers below are pure and memoized: spreadsheet columns such
+# as vintage, ABV and quantity repeat a small set of values across thousands
+# of rows, so each distinct cell value is only converted once per process.
+@lru_cache(maxsize=4096)
 def _coerce_vintage(value: str) -> int | None:
     """Try to coerce a string to a vintage year."""
     if not value:
         return None
-    try:
-        year = int(float(value))
-        if 1900 <= year <= 2100:
-            return year
-    except (ValueError, OverflowError):
-        pass
-    return None
+    match = _VINTAGE_RE.match(value)
+    if match is None:
+        return None
+    year = int(match.group(1))
+    return year if 1900 <= year <= 2100 else None
 
 
+@lru_cache(maxsize=4096)
 def _coerce_float(value: str) -> float | None:
     """Try to coerce a string to a float."""
     if not value:
         return None
-    # Strip % sign if present
-    cleaned = value.replace("%", "").strip()
-    try:
-        return float(cleaned)
-    except (ValueError, OverflowError):
-        return None
+    match = _FLOAT_RE.match(value)
+    return float(match.group(1).replace(",", ".")) if match else None
 
 
+@lru_cache(maxsize=4096)
 def _coerce_int(value: str) -> int | None:
     """Try to coerce a string to an int."""
     if not value:
@@ -81,59 +155,63 @@ def _compute_custom_fields_text(custom_fields: dict[str, str] | None) -> str | N
 
 def row_to_wine_data(
     row: dict[str, Any],
-    mapping: dict[str, str],
+    mapping: dict[str, str] | CompiledMapping,
     owner_id: PydanticObjectId,
     default_quantity: int = 1,
+    now: datetime | None = None,
 ) -> dict[str, Any] | None:
     """Convert a spreadsheet row to Wine constructor kwargs.
 
     Args:
         row: Raw row dict from spreadsheet.
-        mapping: Column mapping dict.
+        mapping: Column mapping dict, or a CompiledMapping for batch callers.
         owner_id: Owner's ID.
         default_quantity: Default quantity if not specified in row.
+        now: Inventory timestamp; batch callers pass one shared value.
 
     Returns:
         Dict of Wine constructor kwargs, or None if row has no name.
     """
+    compiled = _compile_mapping(mapping)
+
+    # Name is required - reject nameless rows before building anything
+    if not any(row.get(header, "").strip() for header in compiled.name_headers):
+        return None
+
     wine_data: dict[str, Any] = {}
-    custom_fields: dict[str, str] = {}
     quantity = default_quantity
 
-    for header, field in mapping.items():
+    for header, field in compiled.text_fields:
         value = row.get(header, "").strip()
-        if not value:
-            continue
-
-        if field == "skip":
-            continue
-        elif field.startswith("custom:"):
-            custom_field_name = field[7:]  # Remove "custom:" prefix
-            custom_fields[custom_field_name] = value
-        elif field == "vintage":
-            coerced = _coerce_vintage(value)
-            if coerced is not None:
-                wine_data["vintage"] = coerced
-        elif field == "alcohol_percentage":
-            coerced = _coerce_float(value)
-            if coerced is not None:
-                wine_data["alcohol_percentage"] = coerced
-        elif field == "quantity":
-            coerced = _coerce_int(value)
-            if coerced is not None and coerced > 0:
-                quantity = coerced
-        elif field in VALID_WINE_FIELDS:
+        if value:
             wine_data[field] = value
 
-    # Name is required
-    if "name" not in wine_data:
-        return None
+    for header in compiled.vintage_headers:
+        coerced = _coerce_vintage(row.get(header, "").strip())
+        if coerced is not None:
+            wine_data["vintage"] = coerced
+
+    for header in compiled.alcohol_headers:
+        coerced = _coerce_float(row.get(header, "").strip())
+        if coerced is not None:
+            wine_data["alcohol_percentage"] = coerced
+
+    for header in compiled.quantity_headers:
+        coerced = _coerce_int(row.get(header, "").strip())
+        if coerced is not None and coerced > 0:
+            quantity = coerced
+
+    custom_fields: dict[str, str] = {}
+    for header, custom_field_name in compiled.custom_fields:
+        value = row.get(header, "").strip()
+        if value:
+            custom_fields[custom_field_name] = value
 
     wine_data["owner_id"] = owner_id
     wine_data["front_label_text"] = ""
     wine_data["inventory"] = InventoryInfo(
         quantity=quantity,
-        updated_at=datetime.now(timezone.utc),
+        updated_at=now or datetime.now(timezone.utc),
     )
 
     if custom_fields:
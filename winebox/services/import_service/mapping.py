@@ -1,8 +1,14 @@
 """Column mapping functions for wine imports."""
 
+import hashlib
 import json
 import logging
 import os
+import time
+from collections import OrderedDict
+from collections.abc import Mapping
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Any
 
 from winebox.config import settings
@@ -16,6 +22,40 @@ from .constants import (
 
 logger = logging.getLogger(__name__)
 
+# AI mapping suggestions cached by prompt content (successful results only)
+AI_MAPPING_CACHE_MAX_ENTRIES = 256
+AI_MAPPING_CACHE_TTL_SECONDS = 3600
+_ai_mapping_cache: OrderedDict[str, tuple[float, dict[str, str]]] = OrderedDict()
+
+# Anthropic client shared across calls, rebuilt if the API key changes
+_anthropic_client: Any = None
+_anthropic_client_key: str | None = None
+
+# Every target an AI mapping value may name directly ("custom:..." is checked separately)
+_VALID_MAPPING_TARGETS: frozenset[str] = VALID_WINE_FIELDS | {"skip"}
+
+# Read-only alias table with case-folded keys, built once at import time
+_ALIAS_TABLE: Mapping[str, str] = MappingProxyType(
+    {alias.casefold(): field for alias, field in HEADER_ALIASES.items()}
+)
+
+
+@lru_cache(maxsize=128)
+def _suggest_column_mapping_cached(headers: tuple[str, ...]) -> tuple[tuple[str, str], ...]:
+    """Compute the static column mapping for a tuple of headers.
+
+    Results are cached so repeated uploads with the same header row skip the
+    alias lookups. Returned as an immutable tuple of pairs so the cached value
+    can never be mutated by a caller.
+
+    Args:
+        headers: Tuple of column header names from the spreadsheet.
+
+    Returns:
+        Tuple of (header, wine field name or "custom:<header>") pairs.
+    """
+    return tuple((header, _static_fallback(header)) for header in headers)
+
 
 def suggest_column_mapping(headers: list[str]) -> dict[str, str]:
     """Auto-suggest column mapping based on header names.
@@ -26,14 +66,7 @@ def suggest_column_mapping(headers: list[str]) -> dict[str, str]:
     Returns:
         Dict mapping header name -> wine field name or "custom:<header>".
     """
-    mapping: dict[str, str] = {}
-    for header in headers:
-        normalized = header.lower().strip()
-        if normalized in HEADER_ALIASES:
-            mapping[header] = HEADER_ALIASES[normalized]
-        else:
-            mapping[header] = f"custom:{header}"
-    return mapping
+    return dict(_suggest_column_mapping_cached(tuple(headers)))
 
 
 def _static_fallback(header: str) -> str:
@@ -45,10 +78,7 @@ def _static_fallback(header: str) -> str:
     Returns:
         Matched wine field name or "custom:<header>".
     """
-    normalized = header.lower().strip()
-    if normalized in HEADER_ALIASES:
-        return HEADER_ALIASES[normalized]
-    return f"custom:{header}"
+    return _ALIAS_TABLE.get(header.strip().casefold(), f"custom:{header}")
 
 
 def _build_mapping_prompt(
@@ -116,11 +146,54 @@ def _is_valid_mapping_value(value: str) -> bool:
     Returns:
         True if the value is valid.
     """
-    if value == "skip":
-        return True
-    if value.startswith("custom:") and len(value) > 7:
-        return True
-    return value in VALID_WINE_FIELDS
+    return value in _VALID_MAPPING_TARGETS or (value.startswith("custom:") and len(value) > 7)
+
+
+def _ai_cache_key(headers: list[str], preview_rows: list[dict[str, Any]]) -> str:
+    """Build a cache key from everything that goes into the AI mapping prompt.
+
+    Args:
+        headers: Column header names from the spreadsheet.
+        preview_rows: Sample rows; only the first 3 are used in the prompt.
+
+    Returns:
+        Hex digest identifying the header set and sample values.
+    """
+    samples = [[str(row.get(header, "")) for header in headers] for row in preview_rows[:3]]
+    payload = json.dumps({"h": headers, "p": samples}, ensure_ascii=False)
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _ai_cache_get(key: str) -> dict[str, str] | None:
+    """Return a copy of a cached AI mapping, or None if missing or expired."""
+    entry = _ai_mapping_cache.get(key)
+    if entry is None:
+        return None
+    stored_at, mapping = entry
+    if time.monotonic() - stored_at > AI_MAPPING_CACHE_TTL_SECONDS:
+        del _ai_mapping_cache[key]
+        return None
+    _ai_mapping_cache.move_to_end(key)
+    return dict(mapping)
+
+
+def _ai_cache_put(key: str, mapping: dict[str, str]) -> None:
+    """Store a validated AI mapping, evicting the least recently used entry."""
+    _ai_mapping_cache[key] = (time.monotonic(), dict(mapping))
+    _ai_mapping_cache.move_to_end(key)
+    while len(_ai_mapping_cache) > AI_MAPPING_CACHE_MAX_ENTRIES:
+        _ai_mapping_cache.popitem(last=False)
+
+
+def _get_anthropic_client(api_key: str) -> Any:
+    """Get an Anthropic client, reusing it (and its connection pool) per API key."""
+    global _anthropic_client, _anthropic_client_key
+    if _anthropic_client is None or _anthropic_client_key != api_key:
+        import anthropic
+
+        _anthropic_client = anthropic.Anthropic(api_key=api_key)
+        _anthropic_client_key = api_key
+    return _anthropic_client
 
 
 async def suggest_column_mapping_ai(
@@ -146,10 +219,15 @@ async def suggest_column_mapping_ai(
         logger.debug("No Anthropic API key available, skipping AI mapping")
         return None
 
-    try:
-        import anthropic
+    # Identical headers + sample values always produce the same prompt
+    cache_key = _ai_cache_key(headers, preview_rows)
+    cached = _ai_cache_get(cache_key)
+    if cached is not None:
+        logger.debug("Using cached AI column mapping")
+        return cached
 
-        client = anthropic.Anthropic(api_key=api_key)
+    try:
+        client = _get_anthropic_client(api_key)
         prompt = _build_mapping_prompt(headers, preview_rows)
 
         message = client.messages.create(
@@ -179,8 +257,7 @@ async def suggest_column_mapping_ai(
             ai_value = result.get(header)
             if ai_value == "skip":
                 validated[header] = f"custom:{header}"
-                continue
-            if ai_value and isinstance(ai_value, str) and _is_valid_mapping_value(ai_value):
+            elif isinstance(ai_value, str) and _is_valid_mapping_value(ai_value):
                 validated[header] = ai_value
             else:
                 validated[header] = _static_fallback(header)
@@ -191,6 +268,7 @@ async def suggest_column_mapping_ai(
                         ai_value,
                     )
 
+        _ai_cache_put(cache_key, validated)
         return validated
 
     except json.JSONDecodeError as e:
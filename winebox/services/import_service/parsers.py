@@ -1,19 +1,49 @@
 """File parsing functions for CSV and XLSX imports."""
 
+import codecs
 import csv
 import io
+from itertools import islice
 from typing import Any
 
 from openpyxl import load_workbook
 
 from .constants import MAX_ROWS
 
+# Chunk size used when validating CSV bytes as UTF-8
+_SNIFF_CHUNK_SIZE = 64 * 1024
+
+
+def _sniff_csv_encoding(file_content: bytes) -> str:
+    """Choose the text encoding for CSV bytes before parsing starts.
+
+    Validates the whole payload as UTF-8 in fixed-size chunks so no full
+    decoded copy is built, and falls back to Latin-1 (which accepts any
+    byte sequence) when it is not valid UTF-8.
+
+    Args:
+        file_content: Raw CSV file bytes.
+
+    Returns:
+        "utf-8-sig" (also strips a leading BOM) or "latin-1".
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    view = memoryview(file_content)
+    try:
+        for start in range(0, len(view), _SNIFF_CHUNK_SIZE):
+            decoder.decode(view[start:start + _SNIFF_CHUNK_SIZE])
+        decoder.decode(b"", final=True)
+    except UnicodeDecodeError:
+        return "latin-1"
+    return "utf-8-sig"
+
 
 def parse_csv(file_content: bytes) -> tuple[list[str], list[dict[str, Any]]]:
     """Parse CSV file content into headers and rows.
 
-    Uses streaming decode via TextIOWrapper to avoid holding the entire
-    decoded text in memory at once. Tries UTF-8 first, falls back to Latin-1.
+    The encoding is sniffed once up front (UTF-8, falling back to Latin-1),
+    then rows are decoded on demand via TextIOWrapper to avoid holding the
+    entire decoded text in memory at once.
 
     Args:
         file_content: Raw CSV file bytes.
@@ -24,35 +54,34 @@ def parse_csv(file_content: bytes) -> tuple[list[str], list[dict[str, Any]]]:
     Raises:
         ValueError: If the CSV is empty or has no headers.
     """
-    # Try each encoding with streaming TextIOWrapper (avoids decoding entire
-    # file into a string at once — memory stays ~1x file size, not 3x).
-    reader = None
-    for encoding in ("utf-8", "latin-1"):
-        try:
-            text_stream = io.TextIOWrapper(io.BytesIO(file_content), encoding=encoding)
-            reader = csv.DictReader(text_stream)
-            # Force header read to trigger any decode error early
-            _ = reader.fieldnames
-            break
-        except (UnicodeDecodeError, csv.Error):
-            reader = None
-            continue
-
-    if reader is None or reader.fieldnames is None:
+    encoding = _sniff_csv_encoding(file_content)
+    text_stream = io.TextIOWrapper(io.BytesIO(file_content), encoding=encoding, newline="")
+    reader = csv.reader(text_stream)
+    try:
+        header_row = next(reader, None)
+    except csv.Error:
+        header_row = None
+
+    if header_row is None:
         raise ValueError("CSV file has no headers")
 
-    headers = [h.strip() for h in reader.fieldnames if h and h.strip()]
+    # Strip headers once and remember which column each valid header came from
+    columns = [(i, h.strip()) for i, h in enumerate(header_row) if h and h.strip()]
+    headers = [h for _, h in columns]
     if not headers:
         raise ValueError("CSV file has no valid headers")
 
-    rows: list[dict[str, Any]] = []
-    for i, row in enumerate(reader):
-        if i >= MAX_ROWS:
-            break
-        # Only include non-empty rows — process one row at a time
-        cleaned = {h.strip(): str(v).strip() if v else "" for h, v in row.items() if h and h.strip()}
-        if any(v for v in cleaned.values()):
-            rows.append(cleaned)
+    # A repeated header keeps only its last column, so only those columns
+    # count when deciding whether a row is empty
+    value_columns = {h: i for i, h in columns}
+
+    # Single pass: blank lines and all-empty rows are rejected before any
+    # dict is built for them.
+    rows: list[dict[str, Any]] = [
+        {h: cells[i].strip() if i < len(cells) else "" for h, i in value_columns.items()}
+        for cells in islice((r for r in reader if r), MAX_ROWS)
+        if any(cells[i].strip() for i in value_columns.values() if i < len(cells))
+    ]
 
     return headers, rows
 
@@ -73,37 +102,43 @@ def parse_xlsx(file_content: bytes) -> tuple[list[str], list[dict[str, Any]]]:
         ValueError: If the XLSX is empty or has no headers.
     """
     wb = load_workbook(filename=io.BytesIO(file_content), read_only=True, data_only=True)
-    ws = wb.active
-    if ws is None:
-        wb.close()
-        raise ValueError("XLSX file has no worksheets")
-
-    # Iterate rows lazily — don't call list() on the whole sheet
-    row_iter = ws.iter_rows(values_only=True)
-
-    # First row = headers
+    # Read-only workbooks keep the archive open until explicitly closed
     try:
-        raw_headers = next(row_iter)
-    except StopIteration:
+        ws = wb.active
+        if ws is None:
+            raise ValueError("XLSX file has no worksheets")
+
+        # Iterate rows lazily — don't call list() on the whole sheet
+        row_iter = ws.iter_rows(values_only=True)
+
+        # First row = headers
+        raw_headers = next(row_iter, None)
+        if raw_headers is None:
+            raise ValueError("XLSX file is empty")
+
+        columns = [
+            (i, str(h).strip()) for i, h in enumerate(raw_headers)
+            if h is not None and str(h).strip()
+        ]
+        headers = [h for _, h in columns]
+        if not headers:
+            raise ValueError("XLSX file has no valid headers")
+
+        # A repeated header keeps only its last column (as in parse_csv)
+        value_columns = {h: i for i, h in columns}
+
+        rows: list[dict[str, Any]] = [
+            {
+                h: str(values[i]).strip() if i < len(values) and values[i] is not None else ""
+                for h, i in value_columns.items()
+            }
+            for values in islice(row_iter, MAX_ROWS)
+            if any(
+                values[i] is not None and str(values[i]).strip()
+                for i in value_columns.values() if i < len(values)
+            )
+        ]
+    finally:
         wb.close()
-        raise ValueError("XLSX file is empty")
 
-    headers = [str(h).strip() if h is not None else "" for h in raw_headers]
-    headers = [h for h in headers if h]
-    if not headers:
-        wb.close()
-        raise ValueError("XLSX file has no valid headers")
-
-    rows: list[dict[str, Any]] = []
-    for i, row_values in enumerate(row_iter):
-        if i >= MAX_ROWS:
-            break
-        row_dict: dict[str, Any] = {}
-        for j, header in enumerate(headers):
-            val = row_values[j] if j < len(row_values) else None
-            row_dict[header] = str(val).strip() if val is not None else ""
-        if any(v for v in row_dict.values()):
-            rows.append(row_dict)
-
-    wb.close()
     return headers, rows
@@ -1,17 +1,51 @@
 """Batch processing for wine imports."""
 
 import logging
+from datetime import datetime, timezone
 
 from beanie import PydanticObjectId
+from pymongo.errors import BulkWriteError
 
 from winebox.models.import_batch import ImportBatch, ImportStatus
 from winebox.models.wine import Wine
 
-from .converters import is_non_wine_row, row_to_wine_data
+from .constants import INSERT_BATCH_SIZE
+from .converters import _compile_mapping, is_non_wine_row, row_to_wine_data
 
 logger = logging.getLogger(__name__)
 
 
+async def _insert_pending(pending: list[tuple[int, Wine]], errors: list[str]) -> int:
+    """Bulk-insert pending wines in one round-trip and clear the list.
+
+    Uses an unordered insert so one bad document does not stop the rest;
+    failures are reported per row in ``errors``.
+
+    Args:
+        pending: (row index, Wine) pairs to insert.
+        errors: Error list to append per-row failures to.
+
+    Returns:
+        Number of wines inserted.
+    """
+    try:
+        await Wine.insert_many([wine for _, wine in pending], ordered=False)
+        inserted = len(pending)
+    except BulkWriteError as e:
+        inserted = e.details.get("nInserted", 0)
+        for write_error in e.details.get("writeErrors", []):
+            row_index = pending[write_error["index"]][0]
+            errors.append(f"Row {row_index + 1}: {write_error.get('errmsg', 'insert failed')}")
+            logger.warning("Import error on row %d: %s", row_index + 1, write_error.get("errmsg"))
+    except Exception as e:
+        inserted = 0
+        for row_index, _ in pending:
+            errors.append(f"Row {row_index + 1}: {str(e)}")
+        logger.warning("Bulk insert of %d wines failed: %s", len(pending), e)
+    pending.clear()
+    return inserted
+
+
 async def process_import_batch(
     batch: ImportBatch,
     owner_id: PydanticObjectId,
@@ -41,28 +75,40 @@ async def process_import_batch(
     wines_created = 0
     rows_skipped = 0
     errors: list[str] = []
+    # One inventory timestamp for the whole batch
+    now = datetime.now(timezone.utc)
+    # (row index, document) pairs waiting for the next bulk insert
+    pending: list[tuple[int, Wine]] = []
+    # Split the mapping by target field once rather than on every row
+    mapping = _compile_mapping(batch.column_mapping)
 
     for i, row in enumerate(batch.rows):
         try:
             # Skip non-wine rows
-            if skip_non_wine and is_non_wine_row(row, batch.column_mapping):
+            if skip_non_wine and is_non_wine_row(row, mapping):
                 rows_skipped += 1
                 continue
 
-            wine_data = row_to_wine_data(row, batch.column_mapping, owner_id, default_quantity)
+            wine_data = row_to_wine_data(
+                row, mapping, owner_id, default_quantity, now=now
+            )
             if wine_data is None:
                 rows_skipped += 1
                 continue
 
-            wine = Wine(**wine_data)
-            await wine.insert()
-            wines_created += 1
+            pending.append((i, Wine(**wine_data)))
 
         except Exception as e:
             error_msg = f"Row {i + 1}: {str(e)}"
             errors.append(error_msg)
             logger.warning("Import error on row %d: %s", i + 1, e)
 
+        if len(pending) >= INSERT_BATCH_SIZE:
+            wines_created += await _insert_pending(pending, errors)
+
+    if pending:
+        wines_created += await _insert_pending(pending, errors)
+
     batch.wines_created = wines_created
     batch.rows_skipped = rows_skipped
     batch.errors = errors
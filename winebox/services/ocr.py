@@ -1,5 +1,6 @@
 """OCR service for extracting text from wine label images."""
 
+import asyncio
 import io
 import logging
 from pathlib import Path
@@ -10,6 +11,54 @@ from winebox.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Longest edge (in pixels) handed to Tesseract. A label photographed at
+# ~300 DPI fits comfortably; larger phone photos only add OCR time.
+OCR_MAX_DIMENSION = 1800
+
+
+def _prepare_image(image: Image.Image) -> Image.Image:
+    """Downscale and grayscale an image for OCR.
+
+    Args:
+        image: Opened PIL image.
+
+    Returns:
+        Grayscale image no larger than OCR_MAX_DIMENSION on either edge.
+    """
+    if max(image.size) > OCR_MAX_DIMENSION:
+        # JPEG can decode straight at a reduced scale before resampling
+        image.draft("RGB", (OCR_MAX_DIMENSION, OCR_MAX_DIMENSION))
+        image = image.copy()
+        image.thumbnail((OCR_MAX_DIMENSION, OCR_MAX_DIMENSION), Image.Resampling.LANCZOS)
+
+    if image.mode != "L":
+        image = image.convert("L")
+    return image
+
+
+def _image_to_text(image: Image.Image) -> str:
+    """Run Tesseract on an image (blocking; call via asyncio.to_thread).
+
+    Args:
+        image: Opened PIL image.
+
+    Returns:
+        Extracted text, stripped.
+    """
+    import pytesseract
+
+    # Preprocess image for better OCR results
+    image = _prepare_image(image)
+
+    # Extract text
+    text = pytesseract.image_to_string(
+        image,
+        lang="eng",
+        config="--psm 6",  # Assume uniform block of text
+    )
+
+    return text.strip()
+
 
 class OCRService:
     """Service for extracting text from images using Tesseract OCR."""
@@ -31,8 +80,6 @@ class OCRService:
             Extracted text from the image.
         """
         try:
-            import pytesseract
-
             # Build full path if relative
             if isinstance(image_path, str) and not Path(image_path).is_absolute():
                 full_path = settings.image_storage_path / image_path
@@ -43,22 +90,10 @@ class OCRService:
                 logger.warning(f"Image file not found: {full_path}")
                 return ""
 
-            # Open image and extract text
+            # Open image and extract text off the event loop, so the front and
+            # back labels can be OCR'd concurrently
             image = Image.open(full_path)
-
-            # Preprocess image for better OCR results
-            # Convert to grayscale
-            if image.mode != "L":
-                image = image.convert("L")
-
-            # Extract text
-            text = pytesseract.image_to_string(
-                image,
-                lang="eng",
-                config="--psm 6",  # Assume uniform block of text
-            )
-
-            return text.strip()
+            return await asyncio.to_thread(_image_to_text, image)
 
         except ImportError:
             logger.error("pytesseract is not installed")
@@ -77,24 +112,9 @@ class OCRService:
             Extracted text from the image.
         """
         try:
-            import pytesseract
-
-            # Open image from bytes
+            # Open image from bytes and extract text off the event loop
             image = Image.open(io.BytesIO(image_data))
-
-            # Preprocess image for better OCR results
-            # Convert to grayscale
-            if image.mode != "L":
-                image = image.convert("L")
-
-            # Extract text
-            text = pytesseract.image_to_string(
-                image,
-                lang="eng",
-                config="--psm 6",  # Assume uniform block of text
-            )
-
-            return text.strip()
+            return await asyncio.to_thread(_image_to_text, image)
 
         except ImportError:
             logger.error("pytesseract is not installed")
@@ -127,10 +147,7 @@ class OCRService:
                 logger.warning(f"Image file not found: {full_path}")
                 return "", 0.0
 
-            image = Image.open(full_path)
-
-            if image.mode != "L":
-                image = image.convert("L")
+            image = _prepare_image(Image.open(full_path))
 
             # Get detailed data with confidence
             data = pytesseract.image_to_data(
@@ -1,6 +1,9 @@
 """Extraction functions for parsing wine information from text."""
 
 import re
+import string
+from collections.abc import Iterator
+from datetime import date
 from typing import Any
 
 from .constants import (
@@ -16,38 +19,113 @@ from .constants import (
     WINE_TYPE_INDICATORS,
 )
 
+# Patterns are compiled once at import time; parse() runs for every label scan
+# Vintages are ASCII digits only, so skip the Unicode \b/\d class lookups
+# The upper bound is checked arithmetically in extract_vintage, so the
+# pattern never needs to be edited as the years roll over.
+_VINTAGE_RE = re.compile(r"\b((?:19|20)\d{2})\b", re.ASCII)
 
-def extract_vintage(text: str) -> int | None:
-    """Extract vintage year from text."""
-    # Look for 4-digit years between 1900 and current year + 2
-    pattern = r"\b(19\d{2}|20[0-2]\d)\b"
-    matches = re.findall(pattern, text)
+# Alcohol patterns, tried in order (earlier patterns are more specific)
+_ALCOHOL_RES = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r"(\d{1,2}[.,]\d{1,2})\s*%\s*(?:vol|alc|alcohol|abv)?",
+        r"(?:alc|alcohol|abv)[:\s]*(\d{1,2}[.,]\d{1,2})\s*%",
+        r"(\d{1,2}[.,]\d{1,2})\s*%\s*vol",
+        r"(\d{1,2})\s*%\s*(?:vol|alc|alcohol|abv)",
+    )
+)
+
+# Lines that can't be a winery or wine name: a bare year, or anything with a
+# percentage (alcohol content). One search per line covers both checks.
+_NON_NAME_LINE_RE = re.compile(r"^\d{4}$|\d+[.,]?\d*\s*%")
+
+# Common label phrases that rule a line out as the winery name
+_WINERY_SKIP_PHRASES = (
+    "product of",
+    "produced by",
+    "bottled by",
+    "imported by",
+    "contains sulfites",
+    "alcohol",
+    "estate",
+    "reserve",
+)
+
+# Grape blend: percentage before grape, and grape before percentage
+_BLEND_PCT_FIRST_RE = re.compile(r"(\d{1,3})\s*%\s*([A-Za-z][A-Za-z\s\''-]+)")
+_BLEND_GRAPE_FIRST_RE = re.compile(r"([A-Za-z][A-Za-z\s\''-]+)\s+(\d{1,3})\s*%")
+
+# Every grape-before-percentage match ends with one of these percentage tails,
+# and its grape text is made only of letters, whitespace, "'" and "-"
+_PCT_TAIL_RE = re.compile(r"\d{1,3}\s*%")
+_LETTER_RE = re.compile(r"[A-Za-z]")
+_BLEND_NAME_CHARS = frozenset(string.ascii_letters + "'-")
+
+# Gazetteers as (lowercased, canonical) pairs in priority order, so lookups
+# don't re-lowercase every entry on every call
+_GRAPE_LOOKUP = tuple((grape.lower(), grape) for grape in GRAPE_VARIETIES)
+_REGION_LOOKUP = tuple((region.lower(), region) for region in WINE_REGIONS)
+_COUNTRY_LOOKUP = tuple(
+    (
+        country.lower(),
+        # US states and "USA" are normalized to the country name
+        "United States" if country in ("California", "Oregon", "Washington", "USA") else country,
+    )
+    for country in WINE_COUNTRIES
+)
 
-    if matches:
+# Default for extract_country's region: tells "not looked up" apart from None
+_UNSET: Any = object()
+
+# Drink window year ranges
+_DRINK_WINDOW_RES = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r"(?:drink|best|optimal|drinking)[:\s]+(\d{4})\s*[-–]\s*(\d{4})",
+        r"(\d{4})\s*[-–]\s*(\d{4})\s*(?:drinking|drink)",
+    )
+)
+
+
+def extract_vintage(text: str, this_year: int | None = None) -> int | None:
+    """Extract vintage year from text.
+
+    Args:
+        text: Label text to search.
+        this_year: Current year; defaults to today's. Cached callers pass
+            it in so their results are keyed on it.
+    """
+    # Most label lines hold no year; a substring check rules them out
+    # without entering the regex engine
+    if "19" not in text and "20" not in text:
+        return None
+
+    # Look for 4-digit years between 1900 and next year
+    if this_year is None:
+        this_year = date.today().year
+    years = [
+        year
+        for year in map(int, _VINTAGE_RE.findall(text))
+        if year <= this_year + 1
+    ]
+
+    if years:
         # Prefer years that look like vintages (not recent years like current year)
-        for year_str in matches:
-            year = int(year_str)
-            if 1950 <= year <= 2025:
+        for year in years:
+            if 1950 <= year < this_year:
                 return year
 
         # Fall back to first found year
-        return int(matches[0])
+        return years[0]
 
     return None
 
 
 def extract_alcohol(text: str) -> float | None:
     """Extract alcohol percentage from text."""
-    # Various patterns for alcohol content
-    patterns = [
-        r"(\d{1,2}[.,]\d{1,2})\s*%\s*(?:vol|alc|alcohol|abv)?",
-        r"(?:alc|alcohol|abv)[:\s]*(\d{1,2}[.,]\d{1,2})\s*%",
-        r"(\d{1,2}[.,]\d{1,2})\s*%\s*vol",
-        r"(\d{1,2})\s*%\s*(?:vol|alc|alcohol|abv)",
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
+    for pattern in _ALCOHOL_RES:
+        match = pattern.search(text)
         if match:
             value = match.group(1).replace(",", ".")
             try:
@@ -60,44 +138,43 @@ def extract_alcohol(text: str) -> float | None:
     return None
 
 
-def extract_grape_variety(text: str) -> str | None:
-    """Extract grape variety from text."""
-    text_lower = text.lower()
-
-    for grape in GRAPE_VARIETIES:
-        if grape.lower() in text_lower:
-            return grape
+def _first_match(text_lower: str, lookup: tuple[tuple[str, str], ...]) -> str | None:
+    """Return the canonical name of the first lookup entry found in the text.
 
+    Entries are checked in list order, so more specific names listed first
+    (e.g. "Cabernet Sauvignon" before "Cabernet") win.
+    """
+    for needle, canonical in lookup:
+        if needle in text_lower:
+            return canonical
     return None
 
 
-def extract_region(text: str) -> str | None:
-    """Extract wine region from text."""
-    text_lower = text.lower()
+def extract_grape_variety(text_lower: str) -> str | None:
+    """Extract grape variety from lowercased text."""
+    return _first_match(text_lower, _GRAPE_LOOKUP)
 
-    for region in WINE_REGIONS:
-        if region.lower() in text_lower:
-            return region
 
-    return None
+def extract_region(text_lower: str) -> str | None:
+    """Extract wine region from lowercased text."""
+    return _first_match(text_lower, _REGION_LOOKUP)
 
 
-def extract_country(text: str) -> str | None:
-    """Extract country from text."""
-    text_lower = text.lower()
+def extract_country(text_lower: str, region: str | None = _UNSET) -> str | None:
+    """Extract country from lowercased text.
 
+    Falls back to inferring the country from the region. Callers that have
+    already extracted the region pass it (None if there was none) to skip
+    scanning for it again.
+    """
     # Direct country mentions
-    for country in WINE_COUNTRIES:
-        if country.lower() in text_lower:
-            # Normalize some entries
-            if country in ["California", "Oregon", "Washington"]:
-                return "United States"
-            if country == "USA":
-                return "United States"
-            return country
+    country = _first_match(text_lower, _COUNTRY_LOOKUP)
+    if country:
+        return country
 
     # Infer from region if possible
-    region = extract_region(text)
+    if region is _UNSET:
+        region = _first_match(text_lower, _REGION_LOOKUP)
     if region:
         return REGION_TO_COUNTRY.get(region)
 
@@ -118,26 +195,13 @@ def extract_winery(text: str) -> str | None:
         if not line:
             continue
 
-        # Skip if it's just a year
-        if re.match(r"^\d{4}$", line):
+        # Skip if it's just a year or looks like alcohol content
+        if _NON_NAME_LINE_RE.search(line):
             continue
 
         # Skip if it's a common label phrase
-        skip_phrases = [
-            "product of",
-            "produced by",
-            "bottled by",
-            "imported by",
-            "contains sulfites",
-            "alcohol",
-            "estate",
-            "reserve",
-        ]
-        if any(phrase in line.lower() for phrase in skip_phrases):
-            continue
-
-        # Skip if it looks like alcohol content
-        if re.search(r"\d+[.,]?\d*\s*%", line):
+        line_lower = line.lower()
+        if any(phrase in line_lower for phrase in _WINERY_SKIP_PHRASES):
             continue
 
         # If line has reasonable length, might be winery name
@@ -168,12 +232,8 @@ def extract_name(text: str, parsed: dict[str, Any]) -> str | None:
         if len(line) < 3 or len(line) > 60:
             continue
 
-        # Skip year-only lines
-        if re.match(r"^\d{4}$", line):
-            continue
-
-        # Skip alcohol percentage lines
-        if re.search(r"\d+[.,]?\d*\s*%", line):
+        # Skip year-only and alcohol percentage lines
+        if _NON_NAME_LINE_RE.search(line):
             continue
 
         candidates.append(line)
@@ -200,10 +260,8 @@ def extract_name(text: str, parsed: dict[str, Any]) -> str | None:
     return None
 
 
-def extract_wine_type(text: str, parsed: dict[str, Any]) -> str | None:
-    """Extract wine type from text or infer from grape variety."""
-    text_lower = text.lower()
-
+def extract_wine_type(text_lower: str, parsed: dict[str, Any]) -> str | None:
+    """Extract wine type from lowercased text or infer from grape variety."""
     # Check for explicit wine type indicators
     for wine_type, indicators in WINE_TYPE_INDICATORS.items():
         for indicator in indicators:
@@ -223,10 +281,8 @@ def extract_wine_type(text: str, parsed: dict[str, Any]) -> str | None:
     return None
 
 
-def extract_classification(text: str) -> str | None:
-    """Extract wine classification from text."""
-    text_lower = text.lower()
-
+def extract_classification(text_lower: str) -> str | None:
+    """Extract wine classification from lowercased text."""
     # Check patterns in order of specificity
     for classification_key in CLASSIFICATION_PRIORITY:
         patterns = CLASSIFICATION_PATTERNS.get(classification_key, [])
@@ -239,6 +295,31 @@ def extract_classification(text: str) -> str | None:
     return None
 
 
+def _grape_first_matches(text: str) -> Iterator[tuple[str, str]]:
+    """Yield the same (grape_text, pct) pairs as _BLEND_GRAPE_FIRST_RE.findall.
+
+    Searching with the pattern directly backtracks quadratically: every
+    letter of a long run of words that isn't followed by "NN%" is retried as
+    a start position. Instead, find each percentage tail first, walk back
+    over the run of name characters before it, and attempt a single match
+    from the run's first letter (later starts in the same run can't succeed
+    if that one fails).
+    """
+    pos = 0
+    for tail in _PCT_TAIL_RE.finditer(text):
+        start = tail.start()
+        while start > pos and (text[start - 1] in _BLEND_NAME_CHARS or text[start - 1].isspace()):
+            start -= 1
+        pos = tail.end()
+
+        letter = _LETTER_RE.search(text, start, tail.start())
+        if letter is None:
+            continue
+        match = _BLEND_GRAPE_FIRST_RE.match(text, letter.start(), tail.end())
+        if match:
+            yield match.group(1), match.group(2)
+
+
 def extract_grape_blend(text: str) -> list[dict[str, Any]] | None:
     """Extract grape blend with percentages from text.
 
@@ -249,37 +330,30 @@ def extract_grape_blend(text: str) -> list[dict[str, Any]] | None:
     blend: list[dict[str, Any]] = []
 
     # Pattern: percentage before grape
-    pattern1 = r"(\d{1,3})\s*%\s*([A-Za-z][A-Za-z\s\''-]+)"
-    matches1 = re.findall(pattern1, text)
+    matches1 = _BLEND_PCT_FIRST_RE.findall(text)
 
     for pct, grape_text in matches1:
         grape_clean = grape_text.strip().rstrip(",;")
         # Check if it's a known grape
-        for grape in GRAPE_VARIETIES:
-            if grape.lower() in grape_clean.lower():
-                blend.append({"name": grape, "percentage": int(pct)})
-                break
+        grape = _first_match(grape_clean.lower(), _GRAPE_LOOKUP)
+        if grape:
+            blend.append({"name": grape, "percentage": int(pct)})
 
     # Pattern: grape before percentage
-    pattern2 = r"([A-Za-z][A-Za-z\s\''-]+)\s+(\d{1,3})\s*%"
-    matches2 = re.findall(pattern2, text)
+    matches2 = _grape_first_matches(text)
 
     for grape_text, pct in matches2:
         grape_clean = grape_text.strip()
         # Check if it's a known grape and not already added
-        for grape in GRAPE_VARIETIES:
-            if grape.lower() in grape_clean.lower():
-                if not any(b["name"] == grape for b in blend):
-                    blend.append({"name": grape, "percentage": int(pct)})
-                break
+        grape = _first_match(grape_clean.lower(), _GRAPE_LOOKUP)
+        if grape and not any(b["name"] == grape for b in blend):
+            blend.append({"name": grape, "percentage": int(pct)})
 
     return blend if blend else None
 
 
-def extract_producer_type(text: str) -> str | None:
-    """Extract producer type from text."""
-    text_lower = text.lower()
-
+def extract_producer_type(text_lower: str) -> str | None:
+    """Extract producer type from lowercased text."""
     # Estate indicators
     estate_indicators = [
         "estate bottled", "estate grown", "estate produced",
@@ -323,14 +397,8 @@ def extract_drink_window(text: str) -> tuple[int, int] | None:
     - "Best 2020-2035"
     - "Optimal drinking: 2022-2030"
     """
-    # Pattern for year ranges
-    patterns = [
-        r"(?:drink|best|optimal|drinking)[:\s]+(\d{4})\s*[-–]\s*(\d{4})",
-        r"(\d{4})\s*[-–]\s*(\d{4})\s*(?:drinking|drink)",
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
+    for pattern in _DRINK_WINDOW_RES:
+        match = pattern.search(text)
         if match:
             try:
                 start_year = int(match.group(1))
@@ -1,6 +1,8 @@
 """Wine parser service for extracting structured data from OCR text."""
 
 import logging
+from datetime import date
+from functools import lru_cache
 from typing import Any
 
 from .extractors import (
@@ -21,6 +23,10 @@ from .extractors import (
 logger = logging.getLogger(__name__)
 
 
+# Parsed results cached by cleaned OCR text (re-scans of the same label)
+PARSE_CACHE_MAX_ENTRIES = 512
+
+
 class WineParserService:
     """Service for parsing wine information from OCR text."""
 
@@ -33,73 +39,92 @@ class WineParserService:
         Returns:
             Dictionary with extracted wine information.
         """
-        result: dict[str, Any] = {}
-
         if not text:
-            return result
-
-        # Clean text
-        text_clean = text.strip()
-
-        # Extract vintage year
-        vintage = extract_vintage(text_clean)
-        if vintage:
-            result["vintage"] = vintage
-
-        # Extract alcohol percentage
-        alcohol = extract_alcohol(text_clean)
-        if alcohol:
-            result["alcohol_percentage"] = alcohol
-
-        # Extract grape variety
-        grape = extract_grape_variety(text_clean)
-        if grape:
-            result["grape_variety"] = grape
-
-        # Extract grape blend (multiple grapes with percentages)
-        grape_blend = extract_grape_blend(text_clean)
-        if grape_blend:
-            result["grape_varieties"] = grape_blend
-
-        # Extract region
-        region = extract_region(text_clean)
-        if region:
-            result["region"] = region
-
-        # Extract country
-        country = extract_country(text_clean)
-        if country:
-            result["country"] = country
-
-        # Try to extract winery name (usually at the top of front label)
-        winery = extract_winery(text_clean)
-        if winery:
-            result["winery"] = winery
-
-        # Try to extract wine name
-        name = extract_name(text_clean, result)
-        if name:
-            result["name"] = name
-
-        # Extract wine type (red, white, etc.)
-        wine_type = extract_wine_type(text_clean, result)
-        if wine_type:
-            result["wine_type"] = wine_type
-
-        # Extract classification
-        classification = extract_classification(text_clean)
-        if classification:
-            result["classification"] = classification
-
-        # Extract producer type
-        producer_type = extract_producer_type(text_clean)
-        if producer_type:
-            result["producer_type"] = producer_type
-
-        # Extract drink window
-        drink_window = extract_drink_window(text_clean)
-        if drink_window:
-            result["drink_window_start"] = drink_window[0]
-            result["drink_window_end"] = drink_window[1]
+            return {}
 
+        # Copy the cached result so callers can't mutate it
+        # The current year is part of the key: vintage selection depends on it
+        result = dict(_parse_cached(text.strip(), date.today().year))
+        if "grape_varieties" in result:
+            result["grape_varieties"] = [dict(grape) for grape in result["grape_varieties"]]
         return result
+
+
+@lru_cache(maxsize=PARSE_CACHE_MAX_ENTRIES)
+def _parse_cached(text_clean: str, this_year: int) -> tuple[tuple[str, Any], ...]:
+    """Run every extractor over cleaned OCR text.
+
+    Args:
+        text_clean: OCR text with surrounding whitespace stripped.
+        this_year: Current year, used to rule out future vintages.
+
+    Returns:
+        Tuple of (field, value) pairs; WineParserService.parse copies it
+        (including the grape_varieties list) before handing it out.
+    """
+    result: dict[str, Any] = {}
+    # Lowercased once for every case-insensitive substring lookup below
+    text_lower = text_clean.lower()
+
+    # Extract vintage year
+    vintage = extract_vintage(text_clean, this_year)
+    if vintage:
+        result["vintage"] = vintage
+
+    # Extract alcohol percentage
+    alcohol = extract_alcohol(text_clean)
+    if alcohol:
+        result["alcohol_percentage"] = alcohol
+
+    # Extract grape variety
+    grape = extract_grape_variety(text_lower)
+    if grape:
+        result["grape_variety"] = grape
+
+    # Extract grape blend (multiple grapes with percentages)
+    grape_blend = extract_grape_blend(text_clean)
+    if grape_blend:
+        result["grape_varieties"] = grape_blend
+
+    # Extract region
+    region = extract_region(text_lower)
+    if region:
+        result["region"] = region
+
+    # Extract country (reusing the region for inference)
+    country = extract_country(text_lower, region)
+    if country:
+        result["country"] = country
+
+    # Try to extract winery name (usually at the top of front label)
+    winery = extract_winery(text_clean)
+    if winery:
+        result["winery"] = winery
+
+    # Try to extract wine name
+    name = extract_name(text_clean, result)
+    if name:
+        result["name"] = name
+
+    # Extract wine type (red, white, etc.)
+    wine_type = extract_wine_type(text_lower, result)
+    if wine_type:
+        result["wine_type"] = wine_type
+
+    # Extract classification
+    classification = extract_classification(text_lower)
+    if classification:
+        result["classification"] = classification
+
+    # Extract producer type
+    producer_type = extract_producer_type(text_lower)
+    if producer_type:
+        result["producer_type"] = producer_type
+
+    # Extract drink window
+    drink_window = extract_drink_window(text_clean)
+    if drink_window:
+        result["drink_window_start"] = drink_window[0]
+        result["drink_window_end"] = drink_window[1]
+
+    return tuple(result.items())